@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
-from importlib import metadata
-
-from .filters import add_filter, get_filter, iter_filters, registry
-from .matchers import add_matcher, build_matcher, get_matcher, iter_matchers, registry as matcher_registry
-from .suite import TestSuite, build_suite
+from importlib import import_module, metadata
+from typing import Any
 
 try:
     __version__ = metadata.version("baygon")
 except metadata.PackageNotFoundError:  # pragma: no cover - used in editable installs
     __version__ = "0.0.0"
 
+# Public names resolved on first access (PEP 562) as ``name -> (module, attribute)``.
+# The registries pull pydantic and the whole schema graph, which the CLI fast
+# paths (``--help``, ``--version``) never need.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "add_filter": (".filters", "add_filter"),
+    "get_filter": (".filters", "get_filter"),
+    "iter_filters": (".filters", "iter_filters"),
+    "registry": (".filters", "registry"),
+    "add_matcher": (".matchers", "add_matcher"),
+    "build_matcher": (".matchers", "build_matcher"),
+    "get_matcher": (".matchers", "get_matcher"),
+    "iter_matchers": (".matchers", "iter_matchers"),
+    "matcher_registry": (".matchers", "registry"),
+    "TestSuite": (".suite", "TestSuite"),
+    "build_suite": (".suite", "build_suite"),
+}
+
 __all__ = [
     "__version__",
     "add_filter",
@@ -28,3 +42,16 @@ __all__ = [
     "build_suite",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
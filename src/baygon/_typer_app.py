@@ -0,0 +1,64 @@
+"""Typer application backing :mod:`baygon.cli` (imported on demand)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from . import __version__
+from .cli import CLIState, _check, _configure_logging, _consoles
+
+app = typer.Typer(add_completion=False, help="Utilities to inspect Baygon configuration files.")
+
+
+def _version_callback(value: bool) -> None:
+    if value:
+        console, _ = _consoles()
+        console.print(__version__)
+        raise typer.Exit()
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    verbose: int = typer.Option(
+        0,
+        "-v",
+        "--verbose",
+        count=True,
+        help="Increase verbosity. Repeat up to three times for more detail.",
+    ),
+    version: bool = typer.Option(
+        False, "--version", help="Show the Baygon version and exit.", callback=_version_callback, is_eager=True
+    ),
+) -> None:
+    """Configure the CLI before dispatching to a sub-command."""
+
+    _ = version  # Typer passes the processed value, but it is handled eagerly by the callback.
+
+    ctx.obj = CLIState(verbosity=verbose)
+    if ctx.invoked_subcommand is None and not verbose:
+        return  # nothing will be logged, e.g. when only the help is shown
+    _configure_logging(verbose)
+
+
+@app.command()
+def check(
+    ctx: typer.Context,
+    config: Path | None = typer.Argument(
+        None,
+        help=(
+            "Path to the Baygon configuration file to validate. When omitted, "
+            "Baygon will search for a suitable configuration file."
+        ),
+    ),
+) -> None:
+    """Validate a configuration file without executing it."""
+
+    code = _check(config, ctx.ensure_object(CLIState))
+    if code:
+        raise typer.Exit(code=code)
+
+
+__all__ = ["app"]
@@ -1,38 +1,47 @@
-"""Command line interface for Baygon."""
+"""Command line interface for Baygon.
+
+Typer (and Click/Rich behind it) is only imported when the application is
+actually built, so ``import baygon.cli`` and ``baygon --version`` stay cheap.
+The ``app`` attribute is still available and resolves to the shared instance.
+"""
 
 from __future__ import annotations
 
-import logging
-from dataclasses import dataclass
+import sys
+from functools import lru_cache
 from pathlib import Path
-
-import typer
-from rich.console import Console
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from . import __version__
-from .loader import ConfigSyntaxError, SyntaxIssue, load_file, locate_config_file
 
-console = Console()
-err_console = Console(stderr=True)
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    import typer
+    from rich.console import Console
 
+    from .loader import SyntaxIssue
 
-@dataclass(slots=True)
-class CLIState:
-    """Runtime configuration shared across commands."""
+    # Built on first access by ``__getattr__``.
+    app: typer.Typer
 
-    verbosity: int = 0
 
+@lru_cache(maxsize=1)
+def _consoles() -> tuple[Console, Console]:
+    """Return the ``(stdout, stderr)`` consoles, importing Rich on first use."""
+
+    from rich.console import Console
+
+    return Console(), Console(stderr=True)
 
-app = typer.Typer(add_completion=False, help="Utilities to inspect Baygon configuration files.")
 
+class CLIState(NamedTuple):
+    """Runtime configuration shared across commands."""
 
-def _version_callback(value: bool) -> None:
-    if value:
-        console.print(__version__)
-        raise typer.Exit()
+    verbosity: int = 0
 
 
 def _configure_logging(verbosity: int) -> None:
+    import logging
+
     level = logging.WARNING
     if verbosity == 1:
         level = logging.INFO
@@ -42,48 +51,20 @@ def _configure_logging(verbosity: int) -> None:
     logging.basicConfig(level=level, format="%(message)s", force=True)
 
 
-@app.callback()
-def main(
-    ctx: typer.Context,
-    verbose: int = typer.Option(
-        0,
-        "-v",
-        "--verbose",
-        count=True,
-        help="Increase verbosity. Repeat up to three times for more detail.",
-    ),
-    version: bool = typer.Option(
-        False, "--version", help="Show the Baygon version and exit.", callback=_version_callback, is_eager=True
-    ),
-) -> None:
-    """Configure the CLI before dispatching to a sub-command."""
-
-    _ = version  # Typer passes the processed value, but it is handled eagerly by the callback.
-
-    ctx.obj = CLIState(verbosity=verbose)
-    _configure_logging(verbose)
-
-
 def _render_issue(issue: SyntaxIssue) -> str:
     location = issue.format_location()
     hint = f" ({issue.hint})" if issue.hint else ""
     return f"[{issue.parser}] {location}: {issue.message}{hint}"
 
 
-@app.command()
-def check(
-    ctx: typer.Context,
-    config: Path | None = typer.Argument(
-        None,
-        help=(
-            "Path to the Baygon configuration file to validate. When omitted, "
-            "Baygon will search for a suitable configuration file."
-        ),
-    ),
-) -> None:
-    """Validate a configuration file without executing it."""
-
-    state = ctx.obj or CLIState()
+def _check(config: Path | None, state: CLIState) -> int:
+    """Validate ``config`` and return the exit code of the ``check`` command."""
+
+    import logging
+
+    from .loader import ConfigSyntaxError, load_file, locate_config_file
+
+    console, err_console = _consoles()
     logger = logging.getLogger(__name__)
     logger.debug("Checking configuration file %s", config)
 
@@ -94,11 +75,11 @@ def check(
         err_console.print(
             f"[red]Error:[/] Could not read '{target}': {exc.strerror or exc}"
         )
-        raise typer.Exit(code=1)
+        return 1
     except OSError as exc:  # pragma: no cover - unexpected I/O errors
         target = str(config) if config is not None else "auto"
         err_console.print(f"[red]Error:[/] Could not read '{target}': {exc}")
-        raise typer.Exit(code=1)
+        return 1
 
     try:
         data = load_file(resolved_config)
@@ -106,18 +87,37 @@ def check(
         err_console.print(f"[red]Syntax error(s) detected in '{resolved_config}':[/]")
         for issue in exc.issues:
             err_console.print(f"  - {_render_issue(issue)}", markup=False)
-        raise typer.Exit(code=1)
+        return 1
 
     logger.debug("Configuration loaded successfully: %s", data)
     if state.verbosity >= 2:
         console.print(data)
     console.print("[green]Configuration looks good![/]")
+    return 0
+
+
+def _build_app() -> typer.Typer:
+    """Import Typer and return the command line application."""
+
+    from ._typer_app import app
+
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    if name == "app":
+        return _build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def run() -> None:
     """Execute the Typer application."""
 
-    app()
+    # Version probes (packaging checks, bug reports) do not need the Typer machinery.
+    if sys.argv[1:] == ["--version"]:
+        print(__version__)
+        return
+    _build_app()()
 
 
 def main_cli() -> None:  # pragma: no cover - compatibility entry-point
@@ -127,4 +127,3 @@ def main_cli() -> None:  # pragma: no cover - compatibility entry-point
 
 
 __all__ = ["app", "run", "main_cli"]
-
@@ -5,20 +5,33 @@ from __future__ import annotations
 import builtins
 import re
 from collections.abc import Mapping
-from types import MappingProxyType
+from functools import lru_cache
+from types import CodeType, MappingProxyType
 from typing import Any
 
+_MISSING = object()
+
+# ``vars`` avoids the sorted copy and per-name ``getattr`` that ``dir`` implies.
 _DEFAULT_BUILTINS: dict[str, Any] = {
-    name: getattr(builtins, name)
-    for name in dir(builtins)
+    name: value
+    for name, value in vars(builtins).items()
     if not name.startswith("_") or name == "__import__"
 }
-_DEFAULT_BUILTINS.setdefault("__import__", builtins.__import__)
 
 
-_MUSTACHE_RE = re.compile(r"\{\{\s*(.+?)\s*\}\}", re.DOTALL)
-_PRE_INC_RE = re.compile(r"(?<!\+)\+\+\s*([A-Za-z_][A-Za-z0-9_]*)")
-_POST_INC_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)\s*\+\+(?!\+)")
+# Greedy negated classes instead of a lazy ``.+?``: a lone ``}`` may appear inside the
+# expression, ``}}`` always closes it. Surrounding blanks are stripped by
+# ``_split_format_spec``.
+_MUSTACHE_RE = re.compile(r"\{\{\s*([^}]+(?:\}(?!\})[^}]*)*)\}\}")
+# String literals (unterminated ones run to the end), brackets and colons: enough to
+# find the top-level ``:`` separating an expression from its format spec.
+_FORMAT_TOKEN_RE = re.compile(
+    r""""(?:\\.|[^"\\])*"?|'(?:\\.|[^'\\])*'?|[\[\](){}:]"""
+)
+_INC_RE = re.compile(
+    r"(?<!\+)\+\+\s*(?P<pre>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<post>[A-Za-z_][A-Za-z0-9_]*)\s*\+\+(?!\+)"
+)
 
 
 class ContextError(RuntimeError):
@@ -43,50 +56,106 @@ def _split_format_spec(expr: str) -> tuple[str, str | None]:
     """Split ``expr`` into (expression, format_spec) while respecting parentheses."""
 
     text = expr.strip()
+    if ":" not in text:
+        return text, None
+
     depth = 0
-    in_string = False
-    string_char = ""
-    escape = False
-
-    for idx, ch in enumerate(text):
-        if in_string:
-            if escape:
-                escape = False
-                continue
-            if ch == "\\":
-                escape = True
-                continue
-            if ch == string_char:
-                in_string = False
-            continue
-        if ch in "'\"":
-            in_string = True
-            string_char = ch
-            continue
-        if ch in "([{":
+    for token in _FORMAT_TOKEN_RE.finditer(text):
+        char = token.group()
+        if char in "([{":
             depth += 1
-            continue
-        if ch in ")]}":
+        elif char in ")]}":
             depth = max(depth - 1, 0)
-            continue
-        if ch == ":" and depth == 0:
-            return text[:idx].strip(), text[idx + 1 :].strip() or None
+        elif char == ":" and depth == 0:
+            return text[: token.start()].strip(), text[token.end() :].strip() or None
     return text, None
 
 
 def _rewrite_increments(expr: str) -> str:
     """Replace occurrences of ``x++`` / ``++x`` with Python helpers."""
 
-    def _pre(match: re.Match[str]) -> str:
-        return f'_ctx_pre_inc("{match.group(1)}")'
+    if "++" not in expr:
+        return expr
+
+    def _replace(match: re.Match[str]) -> str:
+        pre = match.group("pre")
+        if pre is not None:
+            return f'_ctx_pre_inc("{pre}")'
+        return f'_ctx_post_inc("{match.group("post")}")'
+
+    return _INC_RE.sub(_replace, expr)
+
+
+@lru_cache(maxsize=256)
+def _compile_exec(code: str, filename: str) -> CodeType:
+    """Compile ``code`` in ``exec`` mode (setup snippets repeat across tests)."""
+
+    return compile(code, filename, "exec")
+
+
+@lru_cache(maxsize=1024)
+def _compile_expression(expr: str) -> CodeType:
+    """Rewrite increments in ``expr`` and compile it in ``eval`` mode."""
+
+    return compile(_rewrite_increments(expr), "<context>", "eval")
+
+
+TemplatePlan = tuple[tuple[str, str | None, str | None], ...]
+
+
+@lru_cache(maxsize=1024)
+def _parse_template(template: str) -> TemplatePlan:
+    """Split ``template`` into ``(literal, expression, format_spec)`` segments.
+
+    The last segment only carries the trailing literal (``expression`` is ``None``).
+    """
+
+    # ``split`` alternates literals (even indices) and captured expressions (odd ones).
+    parts = _MUSTACHE_RE.split(template)
+    plan: list[tuple[str, str | None, str | None]] = []
+    for index in range(1, len(parts), 2):
+        expr, fmt = _split_format_spec(parts[index])
+        plan.append((parts[index - 1], expr, fmt))
+    plan.append((parts[-1], None, None))
+    return tuple(plan)
 
-    def _post(match: re.Match[str]) -> str:
-        return f'_ctx_post_inc("{match.group(1)}")'
 
-    # Apply pre-increment before post-increment to handle standalone ``++x``
-    rewritten = _PRE_INC_RE.sub(_pre, expr)
-    rewritten = _POST_INC_RE.sub(_post, rewritten)
-    return rewritten
+class Template:
+    """Mustache template parsed once and rendered against any :class:`Context`."""
+
+    __slots__ = ("plan", "source")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.plan = _parse_template(source)
+
+    def render(self, ctx: Context) -> str:
+        return ctx.render(self)
+
+    def __repr__(self) -> str:  # pragma: no cover - repr helper
+        return f"{self.__class__.__name__}({self.source!r})"
+
+
+def compile_templates(value: Any) -> Any:
+    """Turn strings holding ``{{ ... }}`` into :class:`Template` (recursively).
+
+    Containers are copied only when one of their items was compiled, so the result
+    can be handed to :meth:`Context.render_value` at every iteration.
+    """
+
+    if isinstance(value, str):
+        return Template(value) if "{{" in value else value
+    if isinstance(value, list | tuple):
+        items = [compile_templates(item) for item in value]
+        if all(new is old for new, old in zip(items, value, strict=True)):
+            return value
+        return items if isinstance(value, list) else tuple(items)
+    if isinstance(value, dict):
+        mapping = {key: compile_templates(val) for key, val in value.items()}
+        if all(mapping[key] is val for key, val in value.items()):
+            return value
+        return mapping
+    return value
 
 
 class Context:
@@ -105,8 +174,16 @@ class Context:
         builtins_namespace: Mapping[str, Any] | None = None,
         initial: Mapping[str, Any] | None = None,
     ) -> None:
-        allowed_builtins = dict(builtins_namespace or _DEFAULT_BUILTINS)
-        allowed_builtins.setdefault("__import__", builtins.__import__)
+        # Each context keeps its own copy of the builtins. A ``MappingProxyType`` cannot
+        # replace it: CPython needs a real dict for ``__builtins__`` (function calls break
+        # otherwise). Sharing one dict is not an option either: code run in one context
+        # can rebind ``__builtins__`` entries and would leak them into every other one.
+        allowed_builtins: dict[str, Any]
+        if builtins_namespace is None:
+            allowed_builtins = dict(_DEFAULT_BUILTINS)
+        else:
+            allowed_builtins = dict(builtins_namespace)
+            allowed_builtins.setdefault("__import__", builtins.__import__)
 
         self._globals: dict[str, Any] = {
             "__builtins__": allowed_builtins,
@@ -141,7 +218,7 @@ class Context:
         """Execute Python code within the context namespace."""
 
         try:
-            compiled = compile(code, filename, "exec")
+            compiled = _compile_exec(code, filename)
             exec(compiled, self._globals, self._locals)
         except Exception as exc:  # pragma: no cover - formatting only
             raise ContextError(
@@ -156,15 +233,16 @@ class Context:
         if not expr:
             raise ContextError("Empty expression", expression=expression)
 
-        rewritten = _rewrite_increments(expr)
-
         try:
-            compiled = compile(rewritten, "<context>", "eval")
+            compiled = _compile_expression(expr)
         except SyntaxError as exc:
             raise ContextError(
                 f"Invalid expression: {expression}", expression=expression
             ) from exc
 
+        # Expressions compiled in ``eval`` mode resolve names with LOAD_NAME whatever the
+        # namespaces, so merging locals into globals would not speed lookups up; it would
+        # only leak ``__builtins__`` and the increment helpers into ``namespace``.
         try:
             return eval(compiled, self._globals, self._locals)
         except Exception as exc:  # pragma: no cover - depends on user code
@@ -177,22 +255,29 @@ class Context:
     # Mustache rendering
     # ------------------------------------------------------------------
 
-    def render(self, template: str) -> str:
+    def render(self, template: str | Template) -> str:
         """Replace ``{{ ... }}`` with the evaluated expression."""
 
-        if not isinstance(template, str):
+        if isinstance(template, Template):
+            plan = template.plan
+            template = template.source
+        elif not isinstance(template, str):
             raise TypeError("template must be a string")
-
-        def _replace(match: re.Match[str]) -> str:
-            inner = match.group(1)
-            expr, fmt = _split_format_spec(inner)
-            value = self.evaluate(expr)
-            if fmt:
-                return format(value, fmt)
-            return str(value)
-
+        elif "{{" not in template:
+            return template
+        else:
+            plan = _parse_template(template)
+
+        chunks: list[str] = []
+        append = chunks.append
+        evaluate = self.evaluate
         try:
-            return _MUSTACHE_RE.sub(_replace, template)
+            for literal, expr, fmt in plan:
+                append(literal)
+                if expr is None:
+                    continue
+                value = evaluate(expr)
+                append(format(value, fmt) if fmt else str(value))
         except ContextError as err:
             message = err.message
             if err.expression is not None:
@@ -204,41 +289,67 @@ class Context:
                 expression=err.expression,
                 template=template,
             ) from err.__cause__
+        return "".join(chunks)
 
     def render_value(self, value: Any) -> Any:
-        """Apply ``render`` recursively on str/list/tuple/dict."""
+        """Apply ``render`` recursively on str/Template/list/tuple/dict.
+
+        Containers holding no placeholder are returned as-is instead of being copied.
+        """
+
+        return self._render_value(value)[1]
+
+    def _render_value(self, value: Any) -> tuple[bool, Any]:
+        """Return ``(changed, rendered)`` for ``value``."""
 
         if isinstance(value, str):
-            return self.render(value)
-        if isinstance(value, list):
-            return [self.render_value(item) for item in value]
-        if isinstance(value, tuple):
-            return tuple(self.render_value(item) for item in value)
+            if "{{" not in value:
+                return False, value
+            return True, self.render(value)
+        if isinstance(value, Template):
+            return True, self.render(value)
+        if isinstance(value, list | tuple):
+            changed = False
+            items: list[Any] = []
+            for item in value:
+                item_changed, rendered = self._render_value(item)
+                changed = changed or item_changed
+                items.append(rendered)
+            if not changed:
+                return False, value
+            return True, items if isinstance(value, list) else tuple(items)
         if isinstance(value, dict):
-            return {key: self.render_value(val) for key, val in value.items()}
-        return value
+            changed = False
+            mapping: dict[Any, Any] = {}
+            for key, val in value.items():
+                val_changed, rendered = self._render_value(val)
+                changed = changed or val_changed
+                mapping[key] = rendered
+            if not changed:
+                return False, value
+            return True, mapping
+        return False, value
 
     # ------------------------------------------------------------------
     # Increments
     # ------------------------------------------------------------------
 
     def _pre_inc(self, name: str) -> Any:
-        try:
-            current = self._locals[name]
-        except KeyError as exc:  # pragma: no cover - delegated to evaluate
-            raise NameError(name) from exc
-        new_value = current + 1
-        self._locals[name] = new_value
+        namespace = self._locals
+        current = namespace.get(name, _MISSING)
+        if current is _MISSING:
+            raise NameError(name)
+        namespace[name] = new_value = current + 1
         return new_value
 
     def _post_inc(self, name: str) -> Any:
-        try:
-            current = self._locals[name]
-        except KeyError as exc:  # pragma: no cover - delegated to evaluate
-            raise NameError(name) from exc
-        self._locals[name] = current + 1
+        namespace = self._locals
+        current = namespace.get(name, _MISSING)
+        if current is _MISSING:
+            raise NameError(name)
+        namespace[name] = current + 1
         return current
 
 
-__all__ = ["Context", "ContextError"]
+__all__ = ["Context", "ContextError", "Template", "compile_templates"]
 
@@ -3,55 +3,86 @@ Safe Executable wrapper with basic resource limits, timeouts and optional sandbo
 
 Limitations / notes:
  - POSIX: uses resource.setrlimit in preexec_fn (works only on UNIX; preexec_fn is unsafe in multi-threaded programs).
+ - PR_SET_NO_NEW_PRIVS is never set, whether limits go through prlimit(1) or preexec_fn: setuid
+   helpers keep working under uid/gid/chroot. Use an external sandbox to forbid them.
  - Windows: tries to use Job Objects via pywin32 if available, else best-effort fallback.
  - For production-grade sandboxing prefer external tools (nsjail, bubblewrap, firejail, gVisor, containers).
+ - ``in_process`` Python scripts run in a persistent worker pool and bypass every limit above.
 """
 
 from __future__ import annotations
 
+import atexit
+import builtins
 import contextlib
+import io
 import logging
 import os
+import select
+import selectors
 import shutil
+import stat
 import subprocess
 import sys
-from collections import namedtuple
-from collections.abc import Callable, Sequence
-from pathlib import Path
-from types import ModuleType
-from typing import TYPE_CHECKING, Any
+import threading
+import time
+import traceback
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from types import CodeType, ModuleType
+from typing import Any, ClassVar, NamedTuple
 
 logger = logging.getLogger("baygon")
-Outputs = namedtuple("Outputs", ["exit_status", "stdout", "stderr"])
 
-try:
-    import resource  # POSIX-only
-except Exception:
-    resource = None
 
-# Windows job-object helpers (best-effort)
+class Outputs(NamedTuple):
+    """Exit status and captured streams of a run."""
+
+    exit_status: int
+    stdout: str | bytes  # bytes with ``run(..., decode=False)``
+    stderr: str | bytes
+
+
+class RunCase(NamedTuple):
+    """Per-run inputs for :meth:`Executable.run_many`."""
+
+    args: Sequence[object] = ()
+    stdin: str | bytes | None = None
+    env: dict[str, str] | None = None
+
+
 WINDOWS = sys.platform.startswith("win")
 
-if WINDOWS:
-    try:
-        import ctypes as _ctypes  # type: ignore
-    except Exception:  # pragma: no cover - platform specific
-        _ctypes = None
-else:
-    _ctypes = None
 
-# During type checking we want the real module so that attribute resolution works.
-if TYPE_CHECKING:  # pragma: no cover - type checking only
-    pass
+# Platform modules are imported on first use: importing baygon.executable to
+# parse a configuration should not pay for resource/ctypes.
+@lru_cache(maxsize=1)
+def _lazy_resource() -> ModuleType | None:
+    """Return the POSIX ``resource`` module, or ``None`` where it does not exist."""
+    if find_spec("resource") is None:
+        return None
+    import resource
+
+    return resource
 
-ctypes: ModuleType | Any | None = _ctypes
+
+@lru_cache(maxsize=1)
+def _lazy_ctypes() -> ModuleType | None:
+    """Return ``ctypes`` on Windows (job objects), ``None`` elsewhere."""
+    if not WINDOWS or find_spec("ctypes") is None:
+        return None
+    import ctypes
+
+    return ctypes
 
 
 class InvalidExecutableError(Exception):
     """Raised when a provided executable path fails validation."""
 
 
-FORBIDDEN_BINARIES = {"rm", "mv", "dd", "wget", "mkfs"}
+FORBIDDEN_BINARIES = frozenset({"rm", "mv", "dd", "wget", "mkfs"})
 
 
 EnvMapping = dict[str, str]
@@ -62,76 +93,473 @@ def get_env(env: dict[str, str] | None = None) -> EnvMapping:
     return {**os.environ, **(env or {})}
 
 
-def _posix_preexec_fn(
+_POOL: ThreadPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    """Return the shared pool used by :meth:`Executable.run_many` (created on demand)."""
+
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="baygon-run")
+        return _POOL
+
+
+_SCRIPT_POOL: Any = None  # multiprocessing.pool.Pool
+_SCRIPT_POOL_LOCK = threading.Lock()
+
+
+def _script_pool() -> Any:
+    """Return the persistent worker pool running ``in_process`` scripts (created on demand)."""
+
+    global _SCRIPT_POOL
+    with _SCRIPT_POOL_LOCK:
+        if _SCRIPT_POOL is None:
+            import multiprocessing
+
+            # Forking a threaded parent (see ``_pool``) is unsafe: start workers afresh.
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _SCRIPT_POOL = multiprocessing.get_context(method).Pool(os.cpu_count() or 1)
+            atexit.register(_close_script_pool)
+        return _SCRIPT_POOL
+
+
+def _close_script_pool() -> None:
+    global _SCRIPT_POOL
+    with _SCRIPT_POOL_LOCK:
+        pool, _SCRIPT_POOL = _SCRIPT_POOL, None
+    if pool is not None:
+        pool.terminate()
+        pool.join()
+
+
+@lru_cache(maxsize=64)
+def _compile_script(path: str, mtime_ns: int, size: int) -> CodeType | None:
+    """
+    Compile the script at ``path`` once per worker and version of the file.
+
+    ``mtime_ns`` and ``size`` only key the cache: a script rewritten at the same path
+    is compiled again. ``None`` when it cannot be read or compiled; the caller then
+    spawns it, and the interpreter reports the error as usual.
+    """
+    try:
+        with open(path, "rb") as handle:
+            source = handle.read()
+        return compile(source, path, "exec", dont_inherit=True)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+
+def _exit_code(code: object) -> int:
+    """Map a ``SystemExit`` code the way the interpreter does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):  # bool included: sys.exit(True) exits with 1
+        return int(code)
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _run_script(
+    path: str, argv: list[str], stdin: bytes | None, env: dict[str, str] | None, encoding: str
+) -> tuple[int, bytes, bytes] | None:
+    """
+    Worker side of ``in_process``: run the script as ``__main__`` with argv/stdin/env in place.
+
+    Each run gets a fresh ``__main__`` module, so the ``if __name__ == "__main__":`` block
+    and module-level output behave as with ``python script.py``. Returns ``None`` when the
+    script cannot be compiled; the caller spawns it instead.
+    """
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    code = _compile_script(path, info.st_mtime_ns, info.st_size)
+    if code is None:
+        return None
+
+    main = ModuleType("__main__")
+    main.__file__ = path
+    main.__builtins__ = builtins  # type: ignore[attr-defined]
+    out = io.TextIOWrapper(io.BytesIO(), encoding=encoding, write_through=True)
+    err = io.TextIOWrapper(io.BytesIO(), encoding=encoding, write_through=True)
+    saved_argv, saved_stdin, saved_path = sys.argv, sys.stdin, sys.path[:]
+    saved_main = sys.modules["__main__"]
+    saved_env = dict(os.environ) if env else None
+    sys.argv = argv
+    sys.stdin = io.TextIOWrapper(io.BytesIO(stdin or b""), encoding=encoding)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+    sys.modules["__main__"] = main
+    if env:
+        os.environ.update(env)
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                exec(code, vars(main))
+                status = 0
+            except SystemExit as exc:
+                status = _exit_code(exc.code)
+            except Exception as exc:
+                # Leave this frame out, like the interpreter's own report.
+                traceback.print_exception(type(exc), exc, exc.__traceback__.tb_next)
+                status = 1
+    finally:
+        sys.argv, sys.stdin, sys.path[:] = saved_argv, saved_stdin, saved_path
+        sys.modules["__main__"] = saved_main
+        if saved_env is not None:
+            os.environ.clear()
+            os.environ.update(saved_env)
+    out.flush()
+    err.flush()
+    return status, out.buffer.getvalue(), err.buffer.getvalue()
+
+
+@lru_cache(maxsize=64)
+def _compile_preexec(
     cpu_time: int | None = None,
     mem_bytes: int | None = None,
     nproc: int | None = None,
-    no_new_privs: bool = True,
     uid: int | None = None,
     gid: int | None = None,
     chroot_dir: str | None = None,
-):
+) -> Callable[[], None]:
     """
     Returns a function suitable for subprocess.Popen(preexec_fn=...).
     Must be called in the child process. Only on POSIX.
+
+    The body is generated for the requested limits only, so the child runs
+    straight-line code between fork and exec: no None checks, no context
+    managers. Every step stays best-effort.
     """
-    def _inner():
-        # setrlimit wrappers are best-effort
-        if resource is None:
-            return
+    resource = _lazy_resource()
+    steps: list[str] = []
+    if resource is not None:
+        # RLIMIT_CPU in seconds, RLIMIT_AS: total address space
+        for name, value in (("RLIMIT_CPU", cpu_time), ("RLIMIT_AS", mem_bytes), ("RLIMIT_NPROC", nproc)):
+            if value is not None:
+                steps.append(f"setrlimit({getattr(resource, name)}, ({int(value)}, {int(value)}))")
+        # optionally chroot (requires root), then drop privileges
+        if chroot_dir:
+            steps.append(f"os.chroot({os.fspath(chroot_dir)!r})\n        os.chdir('/')")
+        if gid is not None:
+            steps.append(f"os.setgid({int(gid)})")
+        if uid is not None:
+            steps.append(f"os.setuid({int(uid)})")
 
-        if cpu_time is not None:
-            # RLIMIT_CPU in seconds
-            with contextlib.suppress(Exception):
-                resource.setrlimit(resource.RLIMIT_CPU, (cpu_time, cpu_time))
+    body = "".join(f"    try:\n        {step}\n    except Exception:\n        pass\n" for step in steps)
+    source = "def _preexec():\n" + (body or "    pass\n")
+    namespace: dict[str, Any] = {
+        "os": os,
+        "setrlimit": getattr(resource, "setrlimit", None),
+    }
+    exec(compile(source, "<preexec>", "exec"), namespace)
+    return namespace["_preexec"]
 
-        if mem_bytes is not None:
-            # RLIMIT_AS: total address space
-            with contextlib.suppress(Exception):
-                resource.setrlimit(resource.RLIMIT_AS, (mem_bytes, mem_bytes))
 
-        if nproc is not None:
-            with contextlib.suppress(Exception):
-                resource.setrlimit(resource.RLIMIT_NPROC, (nproc, nproc))
+_READ_CHUNK = 65536
+_KILL_GRACE = 1.0  # seconds left to drain the pipes of a killed child
+_PIPE_BUF = getattr(select, "PIPE_BUF", 512)
+_PIPE_SIZE = 1 << 20  # capacity requested for the output pipes (Linux)
 
-        # optionally chroot (requires root)
-        if chroot_dir:
-            try:
-                os.chroot(chroot_dir)
-                os.chdir("/")
-            except Exception:
-                # fail silently; caller should ensure permissions
-                pass
 
-        # drop privileges
-        if gid is not None:
-            with contextlib.suppress(Exception):
-                os.setgid(gid)
-        if uid is not None:
-            with contextlib.suppress(Exception):
-                os.setuid(uid)
+def _grow_pipes(*fds: int) -> None:
+    """
+    Enlarge pipes to ``_PIPE_SIZE`` so a chatty child rarely blocks on a full pipe.
 
-        # prevent gaining new privileges (recommended)
-        if no_new_privs and ctypes is not None:
-            pr_set_no_new_privs = 38
+    Linux only (``F_SETPIPE_SZ``). Best-effort: past ``/proc/sys/fs/pipe-max-size`` or
+    the per-user pipe quota the kernel refuses (EPERM) and the default 64 KiB stays.
+    """
+    import fcntl
+
+    set_size = getattr(fcntl, "F_SETPIPE_SZ", None)
+    if set_size is None:
+        return
+    for fd in fds:
+        with contextlib.suppress(OSError):
+            fcntl.fcntl(fd, set_size, _PIPE_SIZE)
+
+
+def _communicate(
+    proc: subprocess.Popen[bytes], stdin: bytes | None, timeout: float | None
+) -> tuple[bytes, bytes]:
+    """
+    Feed ``stdin`` and drain stdout/stderr of ``proc`` until it exits.
+
+    On timeout the child is killed and whatever it wrote so far is returned.
+    POSIX uses a selector loop reading straight into growing buffers; selectors
+    cannot wait on pipes on Windows, which keeps ``Popen.communicate``.
+    """
+    if WINDOWS:
+        if stdin and len(stdin) <= _PIPE_BUF and proc.stdin is not None:
+            # Fits in the empty pipe: spares communicate() its stdin writer thread.
+            with contextlib.suppress(BrokenPipeError):
+                proc.stdin.write(stdin)
+                proc.stdin.close()
+            stdin = None
+        try:
+            return proc.communicate(input=stdin, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # timeout: kill process tree / job
             with contextlib.suppress(Exception):
-                # linux prctl via ctypes to set no_new_privs
-                libc = ctypes.CDLL("libc.so.6")
-                libc.prctl(pr_set_no_new_privs, 1, 0, 0, 0)
+                proc.kill()
+            proc.wait()
+            return proc.communicate(timeout=1)
+
+    assert proc.stdin is not None and proc.stdout is not None and proc.stderr is not None
+    stdin_fd = proc.stdin.fileno()
+    buffers = {proc.stdout.fileno(): bytearray(), proc.stderr.fileno(): bytearray()}
+    if sys.platform.startswith("linux"):
+        _grow_pipes(*buffers)
+    pending = memoryview(stdin or b"")
+    deadline = None if timeout is None else time.monotonic() + timeout
+    killed = False
+
+    # A pidfd (Linux 5.3+) reports the exit of the child itself: once it fires, only the
+    # data already buffered in the pipes is drained, without waiting for EOF.
+    pidfd = _pidfd_open(proc.pid)
+    exited = False
+
+    with contextlib.ExitStack() as cleanup:
+        selector = cleanup.enter_context(selectors.DefaultSelector())
+        for fd in buffers:
+            selector.register(fd, selectors.EVENT_READ)
+        if pidfd is not None:
+            cleanup.callback(os.close, pidfd)
+            selector.register(pidfd, selectors.EVENT_READ)
+        if len(pending) > _PIPE_BUF:
+            selector.register(stdin_fd, selectors.EVENT_WRITE)
+        else:
+            # Small inputs (the common case) fit atomically in the fresh, empty pipe.
+            with contextlib.suppress(BrokenPipeError):
+                if pending:
+                    os.write(stdin_fd, pending)
+                proc.stdin.close()
+
+        while selector.get_map():
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if killed:
+                        break  # a grandchild still holds the pipes open
+                    with contextlib.suppress(OSError):
+                        proc.kill()
+                    killed = True
+                    deadline = time.monotonic() + _KILL_GRACE
+                    continue
+            events = selector.select(0 if exited else remaining)
+            if exited and not events:
+                break
+            for key, _ in events:
+                if key.fd == pidfd:
+                    selector.unregister(pidfd)
+                    exited = True
+                    continue
+                if key.fd == stdin_fd:
+                    try:
+                        written = os.write(stdin_fd, pending[:_PIPE_BUF])
+                    except BrokenPipeError:
+                        written = len(pending)
+                    pending = pending[written:]
+                    if not pending:
+                        selector.unregister(stdin_fd)
+                        with contextlib.suppress(BrokenPipeError):
+                            proc.stdin.close()
+                    continue
+                chunk = os.read(key.fd, _READ_CHUNK)
+                if chunk:
+                    buffers[key.fd] += chunk
+                else:
+                    selector.unregister(key.fd)
 
-    return _inner
+    if not killed and not exited and deadline is not None:
+        try:
+            proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    proc.wait()
+    proc.stdout.close()
+    proc.stderr.close()
+    with contextlib.suppress(BrokenPipeError):
+        proc.stdin.close()
+
+    stdout, stderr = buffers.values()
+    return bytes(stdout), bytes(stderr)
+
+
+def _pidfd_open(pid: int) -> int | None:
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:  # pragma: no cover - kernels older than 5.3
+        return None
+
+
+def _inheritable_fds() -> bool:
+    """
+    Tell whether a descriptor besides stdin/stdout/stderr would be inherited by a child.
+
+    Only Linux can list its descriptors (``/proc/self/fd``); elsewhere assume there are.
+    """
+    try:
+        fds = os.listdir("/proc/self/fd")
+    except OSError:
+        return True
+    for name in fds:
+        fd = int(name)
+        if fd > 2:
+            with contextlib.suppress(OSError):  # the descriptor listdir used, now closed
+                if os.get_inheritable(fd):
+                    return True
+    return False
+
+
+@lru_cache(maxsize=1)
+def _prlimit_path() -> str | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    return shutil.which("prlimit")
+
+
+def _prlimit_command(
+    cpu_time: int | None, mem_bytes: int | None, nproc: int | None
+) -> list[str] | None:
+    """
+    Return the ``prlimit`` prefix applying the requested limits, if any and available.
+
+    Limits are clamped to our own hard limits: prlimit(1) refuses to raise them and
+    would fail the run, whereas the limits stay best-effort like in ``preexec_fn``.
+    """
+
+    requested = [
+        (option, name, value)
+        for option, name, value in (
+            ("cpu", "RLIMIT_CPU", cpu_time),
+            ("as", "RLIMIT_AS", mem_bytes),
+            ("nproc", "RLIMIT_NPROC", nproc),
+        )
+        if value is not None
+    ]
+    if not requested:
+        return None
+    prlimit = _prlimit_path()
+    resource = _lazy_resource()
+    if prlimit is None or resource is None:
+        return None
+    limits = []
+    for option, name, value in requested:
+        value = int(value)
+        _, hard = resource.getrlimit(getattr(resource, name))
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        limits.append(f"--{option}={value}")
+    return [prlimit, *limits]
 
 
 # Windows Job Object helper (best-effort)
+_JOB_OBJECT_LIMIT_PROCESS_TIME = 0x00000002
+_JOB_OBJECT_LIMIT_PROCESS_MEMORY = 0x00000100
+_JOB_OBJECT_EXTENDED_LIMIT_INFORMATION_CLASS = 9
+
+
+@lru_cache(maxsize=1)
+def _job_limit_information_type() -> Any:
+    """Build the ``JOBOBJECT_EXTENDED_LIMIT_INFORMATION`` structure (Windows only)."""
+
+    import ctypes
+    from ctypes import wintypes
+
+    class JobObjectBasicLimitInformation(ctypes.Structure):
+        _fields_ = [
+            ("PerProcessUserTimeLimit", ctypes.c_int64),
+            ("PerJobUserTimeLimit", ctypes.c_int64),
+            ("LimitFlags", wintypes.DWORD),
+            ("MinimumWorkingSetSize", ctypes.c_size_t),
+            ("MaximumWorkingSetSize", ctypes.c_size_t),
+            ("ActiveProcessLimit", wintypes.DWORD),
+            ("Affinity", ctypes.c_size_t),
+            ("PriorityClass", wintypes.DWORD),
+            ("SchedulingClass", wintypes.DWORD),
+        ]
+
+    class IoCounters(ctypes.Structure):
+        _fields_ = [
+            (name, ctypes.c_uint64)
+            for name in (
+                "ReadOperationCount",
+                "WriteOperationCount",
+                "OtherOperationCount",
+                "ReadTransferCount",
+                "WriteTransferCount",
+                "OtherTransferCount",
+            )
+        ]
+
+    class JobObjectExtendedLimitInformation(ctypes.Structure):
+        _fields_ = [
+            ("BasicLimitInformation", JobObjectBasicLimitInformation),
+            ("IoInfo", IoCounters),
+            ("ProcessMemoryLimit", ctypes.c_size_t),
+            ("JobMemoryLimit", ctypes.c_size_t),
+            ("PeakProcessMemoryUsed", ctypes.c_size_t),
+            ("PeakJobMemoryUsed", ctypes.c_size_t),
+        ]
+
+    return JobObjectExtendedLimitInformation
+
 class _WinJob:
-    """Best-effort Windows Job Object wrapper used to apply limits."""
+    """Best-effort Windows Job Object wrapper used to apply limits.
+
+    Limits are per process, so one job per distinct ``(cpu_time_ms, memory_bytes)``
+    pair is created on first use and shared by every later run; handles are closed
+    at interpreter exit.
+    """
+
+    _jobs: ClassVar[dict[tuple[int | None, int | None], _WinJob]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, cpu_time_ms: int | None = None, memory_bytes: int | None = None):
         self.job: int | None = None
         self.cpu_time_ms = cpu_time_ms
         self.memory_bytes = memory_bytes
 
+    @classmethod
+    def get_or_create(
+        cls, cpu_time_ms: int | None = None, memory_bytes: int | None = None
+    ) -> _WinJob | None:
+        key = (cpu_time_ms, memory_bytes)
+        with cls._lock:
+            job = cls._jobs.get(key)
+            if job is None:
+                job = cls(cpu_time_ms=cpu_time_ms, memory_bytes=memory_bytes)
+                if job.create() is None:
+                    return None
+                if not cls._jobs:
+                    atexit.register(cls.close_all)
+                cls._jobs[key] = job
+        return job
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._lock:
+            jobs, cls._jobs = list(cls._jobs.values()), {}
+        if not jobs:
+            return
+        kernel32 = cls._kernel32()
+        for job in jobs:
+            if kernel32 is not None and job.job:
+                with contextlib.suppress(Exception):
+                    kernel32.CloseHandle(job.job)
+            job.job = None
+
     @staticmethod
+    @lru_cache(maxsize=1)
     def _kernel32() -> Any | None:
+        ctypes = _lazy_ctypes()
         if ctypes is None:
             return None
         windll = getattr(ctypes, "windll", None)
@@ -143,16 +571,35 @@ class _WinJob:
         kernel32 = self._kernel32()
         if kernel32 is None:
             return None
-        # Minimal safe-guard: create job and return handle; detailed limit setting omitted for brevity
-        # For robust implementation, prefer pywin32 and JobObjectExtendedLimitInformation structures.
-        # Here we just create a job and return it.
         job = kernel32.CreateJobObjectW(None, None)
         if job == 0:
             return None
         self.job = job
-        # NOTE: proper limit configuration requires building JOBOBJECT_EXTENDED_LIMIT_INFORMATION struct.
+        if self.cpu_time_ms is not None or self.memory_bytes is not None:
+            with contextlib.suppress(Exception):
+                self._set_limits(kernel32)
         return job
 
+    def _set_limits(self, kernel32: Any) -> None:
+        import ctypes
+
+        info = _job_limit_information_type()()
+        flags = 0
+        if self.cpu_time_ms is not None:
+            # LARGE_INTEGER in 100 ns ticks
+            info.BasicLimitInformation.PerProcessUserTimeLimit = self.cpu_time_ms * 10_000
+            flags |= _JOB_OBJECT_LIMIT_PROCESS_TIME
+        if self.memory_bytes is not None:
+            info.ProcessMemoryLimit = self.memory_bytes
+            flags |= _JOB_OBJECT_LIMIT_PROCESS_MEMORY
+        info.BasicLimitInformation.LimitFlags = flags
+        kernel32.SetInformationJobObject(
+            self.job,
+            _JOB_OBJECT_EXTENDED_LIMIT_INFORMATION_CLASS,
+            ctypes.byref(info),
+            ctypes.sizeof(info),
+        )
+
     def assign(self, pid: int) -> bool:
         kernel32 = self._kernel32()
         if kernel32 is None or self.job is None:
@@ -168,35 +615,65 @@ class _WinJob:
         return bool(res)
 
 
+@lru_cache(maxsize=1024)
+def _resolve(filename: str, cwd: str, search_path: str | None) -> str:
+    """
+    Return the path to execute for ``filename`` or raise :class:`InvalidExecutableError`.
+
+    ``cwd`` and ``search_path`` (``$PATH``) are not used directly: they only key the
+    cache, since relative names and ``shutil.which`` lookups depend on them. Failures
+    are not cached.
+    """
+    if Executable._is_executable(filename):
+        return filename
+    resolved = filename
+    if "/" not in filename:
+        located = shutil.which(filename)
+        if located:
+            if filename in FORBIDDEN_BINARIES:
+                raise InvalidExecutableError(f"Program '{filename}' is forbidden!")
+            resolved = located
+    if not Executable._is_executable(resolved):
+        raise InvalidExecutableError(f"Program '{resolved}' is not an executable!")
+    return resolved
+
+
 class Executable:
     """Wrapper that executes binaries with optional resource constraints."""
     filename: str
     encoding: str
+    in_process: bool
 
-    def __new__(cls, filename: Executable | str | os.PathLike[str] | None):
+    def __new__(cls, filename: Executable | str | os.PathLike[str] | None, *args: Any, **kwargs: Any):
         if isinstance(filename, cls):
             return filename
         return super().__new__(cls) if filename else None
 
-    def __init__(self, filename: Executable | str | os.PathLike[str], encoding: str = "utf-8"):
+    def __init__(
+        self,
+        filename: Executable | str | os.PathLike[str],
+        encoding: str = "utf-8",
+        in_process: bool = False,
+    ):
+        """
+        - in_process: opt-in for Python scripts (``*.py``). Runs without ``timeout``,
+            limits or sandbox execute the script as ``__main__`` in a persistent worker
+            pool instead of starting a new interpreter; it is compiled once per worker and
+            version of the file, with fresh globals on every run. What differs from
+            ``python script.py``: modules it imports stay loaded in the worker (their
+            state carries over between runs), and threads or ``atexit`` handlers it leaves
+            behind are not waited for. Scripts that do not compile are spawned as usual.
+        """
         if isinstance(filename, self.__class__):
+            # Already validated (``__new__`` hands back the very same instance).
             self.filename = filename.filename
             self.encoding = filename.encoding
-        else:
-            self.filename = os.fspath(filename)
-            self.encoding = encoding
-
-        resolved = self.filename
-        if not self._is_executable(resolved):
-            if "/" not in resolved:
-                located = shutil.which(resolved)
-                if located:
-                    if resolved in FORBIDDEN_BINARIES:
-                        raise InvalidExecutableError(f"Program '{resolved}' is forbidden!")
-                    self.filename = located
-                    resolved = located
-            if not self._is_executable(resolved):
-                raise InvalidExecutableError(f"Program '{resolved}' is not an executable!")
+            self.in_process = filename.in_process
+            return
+
+        self.encoding = encoding
+        self.filename = _resolve(os.fspath(filename), os.getcwd(), os.environ.get("PATH"))
+        self.in_process = in_process and self.filename.endswith(".py")
 
     def run(
         self,
@@ -212,62 +689,98 @@ class Executable:
         chroot_dir: str | None = None,
         use_external_sandbox: SandboxConfig | None = None,  # e.g. {"tool":"nsjail","args":[...]}
         hook: Callable[..., None] | None = None,
+        decode: bool = True,
     ) -> Outputs:
         """
         Run executable with resource constraints.
 
+        - decode: when false, stdout/stderr are returned as raw ``bytes`` and the text
+            conversion is left to the caller. Otherwise bytes that are invalid in
+            ``encoding`` are replaced with U+FFFD.
+
         - use_external_sandbox: if provided, runs the command through an external tool, e.g.
-            {"tool": "nsjail", "args": ["--config", "/etc/nsjail.cfg"]}
+            {"tool": "nsjail", "args": ["--config", "/etc/nsjail.cfg"]}; ``args`` must be a
+            list or a tuple, anything else is ignored.
+
+        - hook: ``None`` or a callable, called with the keyword arguments ``cmd``, ``stdin``,
+            ``stdout``, ``stderr`` and ``exit_status`` once the run is over.
         """
 
-        cmd = [self.filename, *[str(a) for a in args]]
+        # Every part of ``cmd`` is a ``str`` from here on, Popen takes it as is.
+        cmd = [self.filename]
+        cmd.extend(arg if type(arg) is str else str(arg) for arg in args)
+
+        if stdin is None:
+            stdin_bytes = None
+        elif isinstance(stdin, bytes):
+            stdin_bytes = stdin
+        else:
+            stdin_bytes = stdin.encode(self.encoding)
+
+        # A stuck script cannot be killed without taking the shared pool down, hence
+        # no timeout; limits and sandboxes need a process of their own.
+        if self.in_process and not use_external_sandbox and all(
+            x is None for x in (timeout, cpu_time, mem_bytes, nproc, uid, gid, chroot_dir)
+        ):
+            outcome = _script_pool().apply(_run_script, (self.filename, cmd, stdin_bytes, env, self.encoding))
+            if outcome is not None:
+                return self._outputs(cmd, stdin, *outcome, decode=decode, hook=hook)
+            self.in_process = False
 
         # If external sandbox requested, wrap command.
         if use_external_sandbox:
             tool = use_external_sandbox.get("tool")
             extra = use_external_sandbox.get("args")
             if tool:
-                extra_args: list[str]
-                if isinstance(extra, Sequence) and not isinstance(extra, str | bytes):
-                    extra_args = [str(arg) for arg in extra]
-                else:
-                    extra_args = []
                 # naive wrapper: tool + extra + -- cmd...
                 # user must ensure tool is present and args are correct
-                cmd = [str(tool), *extra_args, "--", *cmd]
+                wrapped = [str(tool)]
+                if type(extra) is list or type(extra) is tuple:
+                    wrapped.extend(str(arg) for arg in extra)
+                wrapped.append("--")
+                wrapped.extend(cmd)
+                cmd = wrapped
 
         popen_kwargs: dict[str, object] = {
             "stdout": subprocess.PIPE,
             "stdin": subprocess.PIPE,
             "stderr": subprocess.PIPE,
-            "env": get_env(env),
+            # Without overrides the child simply inherits our environment: no copy needed.
+            "env": get_env(env) if env else None,
             "text": False,  # we handle encoding manually
         }
 
+        # ``argv`` is what gets spawned; hooks keep seeing ``cmd``, without our prlimit prefix.
+        argv = cmd
         preexec = None
         win_job = None
         if not WINDOWS:
             # POSIX: set resource limits in child
-            if any(x is not None for x in (cpu_time, mem_bytes, nproc, uid, gid, chroot_dir)):
-                if resource is None:
+            prlimit = _prlimit_command(cpu_time, mem_bytes, nproc)
+            if prlimit and uid is None and gid is None and chroot_dir is None:
+                # Plain rlimits: let prlimit(1) apply them so Popen can take the
+                # posix_spawn path instead of fork + preexec_fn.
+                argv = [*prlimit, "--", *cmd]
+            elif any(x is not None for x in (cpu_time, mem_bytes, nproc, uid, gid, chroot_dir)):
+                if _lazy_resource() is None:
                     logger.warning("resource module not available on this platform")
                 else:
-                    preexec = _posix_preexec_fn(cpu_time=cpu_time, mem_bytes=mem_bytes,
-                                                nproc=nproc, uid=uid, gid=gid, chroot_dir=chroot_dir)
+                    preexec = _compile_preexec(cpu_time=cpu_time, mem_bytes=mem_bytes,
+                                               nproc=nproc, uid=uid, gid=gid, chroot_dir=chroot_dir)
                     popen_kwargs["preexec_fn"] = preexec
+            if preexec is None and sys.version_info < (3, 13) and not _inheritable_fds():
+                # Before 3.13 posix_spawn also requires close_fds=False, harmless while no
+                # descriptor besides the standard streams would leak to the child.
+                popen_kwargs["close_fds"] = False
         else:
-            # Windows: create job object with limits (best-effort)
-            if ctypes is not None:
-                win_job = _WinJob(cpu_time_ms=(cpu_time * 1000 if cpu_time else None),
-                                  memory_bytes=mem_bytes)
-                job_handle = win_job.create()
-                if job_handle:
-                    # we will assign after spawn
-                    pass
+            # Windows: reuse the job object holding these limits (best-effort),
+            # the child is assigned to it after spawn
+            if _lazy_ctypes() is not None:
+                win_job = _WinJob.get_or_create(cpu_time_ms=(cpu_time * 1000 if cpu_time else None),
+                                                memory_bytes=mem_bytes)
 
         # spawn
-        cmd_args = [str(x) for x in cmd]
-        proc = subprocess.Popen(cmd_args, **popen_kwargs)
+        proc = subprocess.Popen(argv, **popen_kwargs)
 
         # assign to job on Windows
         if WINDOWS and win_job and win_job.job:
@@ -275,45 +788,59 @@ class Executable:
                 win_job.assign(proc.pid)
 
         try:
-            stdout_bytes: bytes | None
-            stderr_bytes: bytes | None
-            if stdin is None:
-                stdin_bytes = None
-            elif isinstance(stdin, bytes):
-                stdin_bytes = stdin
-            else:
-                stdin_bytes = stdin.encode(self.encoding)
-
-            stdout_bytes, stderr_bytes = proc.communicate(input=stdin_bytes, timeout=timeout)
-        except subprocess.TimeoutExpired:
-            # timeout: kill process tree / job
-            with contextlib.suppress(Exception):
-                proc.kill()
-            proc.wait()
-            stdout_bytes, stderr_bytes = proc.communicate(timeout=1)
+            stdout_bytes, stderr_bytes = _communicate(proc, stdin_bytes, timeout)
         except Exception:
             proc.kill()
             proc.wait()
             raise
 
-        stdout_text = ""
-        if stdout_bytes is not None:
-            try:
-                stdout_text = stdout_bytes.decode(self.encoding)
-            except Exception:
-                stdout_text = stdout_bytes.decode(errors="ignore")
+        return self._outputs(cmd, stdin, proc.returncode, stdout_bytes, stderr_bytes, decode=decode, hook=hook)
 
-        stderr_text = ""
-        if stderr_bytes is not None:
-            try:
-                stderr_text = stderr_bytes.decode(self.encoding)
-            except Exception:
-                stderr_text = stderr_bytes.decode(errors="ignore")
+    def _outputs(
+        self,
+        cmd: list[str],
+        stdin: str | bytes | None,
+        exit_status: int,
+        stdout_bytes: bytes | None,
+        stderr_bytes: bytes | None,
+        *,
+        decode: bool,
+        hook: Callable[..., None] | None,
+    ) -> Outputs:
+        """Build the :class:`Outputs` of a finished run and report it to ``hook``."""
+
+        stdout: str | bytes
+        stderr: str | bytes
+        if not decode:
+            stdout = stdout_bytes if stdout_bytes is not None else b""
+            stderr = stderr_bytes if stderr_bytes is not None else b""
+        else:
+            # Invalid sequences become U+FFFD rather than being dropped.
+            stdout = stdout_bytes.decode(self.encoding, errors="replace") if stdout_bytes else ""
+            stderr = stderr_bytes.decode(self.encoding, errors="replace") if stderr_bytes else ""
+
+        if hook is not None:
+            hook(cmd=cmd, stdin=stdin, stdout=stdout, stderr=stderr, exit_status=exit_status)
 
-        if hook and callable(hook):
-            hook(cmd=cmd_args, stdin=stdin, stdout=stdout_text, stderr=stderr_text, exit_status=proc.returncode)
+        return Outputs(exit_status, stdout, stderr)
+
+    def run_many(self, cases: Iterable[RunCase], **kwargs: Any) -> list[Outputs]:
+        """
+        Run the executable once per case, keeping up to ``os.cpu_count()`` children alive.
 
-        return Outputs(proc.returncode, stdout_text, stderr_text)
+        Each child is still a separate process; waiting on its pipes releases the GIL so a
+        thread pool is enough to overlap them. ``kwargs`` (timeout, limits, hook, ...) are
+        shared by all cases. Results are returned in the order of ``cases``.
+
+        Spawning and reaping stay on the portable ``subprocess`` primitives; an io_uring
+        backend would need a native dependency for a gain limited to syscall overhead.
+        """
+
+        futures = [
+            _pool().submit(self.run, *case.args, stdin=case.stdin, env=case.env, **kwargs)
+            for case in cases
+        ]
+        return [future.result() for future in futures]
 
     def __call__(self, *args, **kwargs):
         return self.run(*args, **kwargs)
@@ -323,5 +850,20 @@ class Executable:
 
     @staticmethod
     def _is_executable(filename: str | os.PathLike[str]) -> bool:
-        path = Path(filename)
-        return path.is_file() and os.access(path, os.X_OK)
+        # One stat() instead of is_file() + access(); the x bits are checked for
+        # anyone, a child lacking the permission fails at spawn time instead.
+        try:
+            mode = os.stat(filename).st_mode
+        except (OSError, ValueError):
+            return False
+        return stat.S_ISREG(mode) and bool(mode & 0o111)
+
+
+__all__ = [
+    "FORBIDDEN_BINARIES",
+    "Executable",
+    "InvalidExecutableError",
+    "Outputs",
+    "RunCase",
+    "get_env",
+]
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import ast
 import inspect
+import math
 import re
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Iterator, MutableMapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, MutableMapping, Sequence
+from functools import cache, lru_cache
+from operator import methodcaller
 from typing import Any, ClassVar
 
 from pydantic import BaseModel, create_model
@@ -33,6 +37,11 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when optional dep mis
                 return self.glb.get("_")
             return eval(compiled, self.glb, self.glb)
 
+try:  # pragma: no cover - optional linear-time regex engine
+    import re2  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - stdlib ``re`` is used instead
+    re2 = None
+
 __all__ = [
     "Filter",
     "FilterError",
@@ -55,15 +64,13 @@ __all__ = [
 ]
 
 
+# Word boundaries of a CamelCase name: before an uppercase letter that follows a
+# non-uppercase character, or that starts a capitalised word ("HTTPServer").
+_CAMEL_BOUNDARY = re.compile(r"(?<=[^A-Z])(?=[A-Z])|(?<=.)(?=[A-Z][a-z])")
+
+
 def _camel_to_snake(name: str) -> str:
-    parts = []
-    for index, char in enumerate(name):
-        if char.isupper() and index and (
-            not name[index - 1].isupper() or (index + 1 < len(name) and name[index + 1].islower())
-        ):
-            parts.append("_")
-        parts.append(char.lower())
-    return "".join(parts)
+    return _CAMEL_BOUNDARY.sub("_", name).lower()
 
 
 class FilterError(RuntimeError):
@@ -75,6 +82,14 @@ class Filter(ABC):
 
     #: Optional explicit registry name.
     registry_name: ClassVar[str | None] = None
+    #: Model built by :meth:`schema_model`, stored on each class separately.
+    _schema_cache: ClassVar[type[BaseModel] | None] = None
+    #: Canonical registry name, resolved when the subclass is created.
+    _registry_name: ClassVar[str] = ""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._registry_name = cls.registry_name or _camel_to_snake(cls.__name__.removeprefix("Filter"))
 
     def __init__(self, *, input: bool = False) -> None:
         self.input = input
@@ -93,16 +108,12 @@ class Filter(ABC):
     def name(cls) -> str:
         """Return the canonical registry name for the filter class."""
 
-        if cls.registry_name:
-            return cls.registry_name
-        name = cls.__name__
-        if name.startswith("Filter"):
-            name = name[len("Filter") :]
-        return _camel_to_snake(name)
+        return cls._registry_name
 
     @classmethod
+    @cache
     def signature(cls) -> inspect.Signature:
-        """Return the ``__init__`` signature for the filter."""
+        """Return the ``__init__`` signature for the filter (computed once per class)."""
 
         return inspect.signature(cls.__init__)
 
@@ -110,6 +121,11 @@ class Filter(ABC):
     def schema_model(cls) -> type[BaseModel]:
         """Return a Pydantic model mirroring the filter constructor."""
 
+        # Read the class' own dict: a subclass must not reuse its parent's model.
+        cached = cls.__dict__.get("_schema_cache")
+        if cached is not None:
+            return cached
+
         fields: dict[str, tuple[Any, Any]] = {}
         signature = cls.signature()
         for name, param in signature.parameters.items():
@@ -123,7 +139,9 @@ class Filter(ABC):
             default = param.default if param.default is not inspect._empty else ...
             fields[name] = (annotation, default)
         model_name = f"{cls.__name__}Config"
-        return create_model(model_name, **fields)  # type: ignore[arg-type]
+        model = create_model(model_name, **fields)  # type: ignore[arg-type]
+        cls._schema_cache = model
+        return model
 
 
 class Filters(Sequence[Filter]):
@@ -134,6 +152,21 @@ class Filters(Sequence[Filter]):
             self._filters: list[Filter] = []
         else:
             self._filters = [self._coerce(item) for item in filters]
+        self._rebind()
+
+    @classmethod
+    def _from_trusted(cls, filters: list[Filter]) -> Filters:
+        """
+        Wrap a list already known to hold only filters, skipping per-item checks.
+
+        The list is copied: changes the caller makes to it later do not reach the
+        bound chain of the instance.
+        """
+
+        instance = cls.__new__(cls)
+        instance._filters = list(filters)
+        instance._rebind()
+        return instance
 
     @staticmethod
     def _coerce(filter_: Filter) -> Filter:
@@ -141,6 +174,52 @@ class Filters(Sequence[Filter]):
             raise TypeError("Filters collection expects Filter instances")
         return filter_
 
+    @staticmethod
+    def _bind(filter_: Filter) -> Callable[[str], str]:
+        # ``Filter.filter`` only forwards to ``apply``: skip that hop unless overridden.
+        if type(filter_).filter is Filter.filter:
+            return filter_.apply
+        return filter_.filter
+
+    def _rebind(self) -> None:
+        """
+        Resolve the callables run by :meth:`apply`, leaving out no-op filters.
+
+        Consecutive builtin string filters (``trim``, ``uppercase``, ...) are fused into
+        a single generated function, and longer runs of single character ``replace``
+        filters into one ``str.translate`` call.
+        """
+
+        bound: list[Callable[[str], str]] = []
+        run: list[Filter] = []
+        run_kind: str | None = None
+
+        def flush() -> None:
+            if run_kind == "str" and len(run) > 1:
+                bound.append(_fuse(tuple(_FUSABLE_FILTERS[type(item)] for item in run)))
+            elif run_kind == "char" and len(run) >= _MIN_TRANSLATE_RUN:
+                bound.append(methodcaller("translate", _translate_table(run)))  # type: ignore[arg-type]
+            else:
+                bound.extend(self._bind(item) for item in run)
+            run.clear()
+
+        for filter_ in self._filters:
+            kind = type(filter_)
+            if kind is FilterNone:
+                continue
+            if kind in _FUSABLE_FILTERS:
+                group = "str"
+            elif kind is FilterReplace and len(filter_.pattern) == len(filter_.replacement) == 1:  # type: ignore[attr-defined]
+                group = "char"
+            else:
+                group = None
+            if group != run_kind:
+                flush()
+                run_kind = group
+            run.append(filter_)
+        flush()
+        self._bound: tuple[Callable[[str], str], ...] = tuple(bound)
+
     def __iter__(self) -> Iterator[Filter]:
         return iter(self._filters)
 
@@ -152,16 +231,25 @@ class Filters(Sequence[Filter]):
 
     def append(self, filter_: Filter) -> None:
         self._filters.append(self._coerce(filter_))
+        self._rebind()
 
     def extend(self, filters: Iterable[Filter]) -> None:
-        for filter_ in filters:
-            self.append(filter_)
+        self._filters.extend([self._coerce(filter_) for filter_ in filters])
+        self._rebind()
 
     def apply(self, value: str) -> str:
-        for filter_ in self._filters:
-            value = filter_.filter(value)
+        for apply in self._bound:
+            value = apply(value)
         return value
 
+    def apply_many(self, values: Iterable[str]) -> list[str]:
+        """Apply the chain to every value, one filter at a time over the whole batch."""
+
+        result = list(values)
+        for apply in self._bound:
+            result = [apply(value) for value in result]
+        return result
+
 
 class FilterRegistry(MutableMapping[str, type[Filter]]):
     """Registry of available filter classes."""
@@ -259,9 +347,15 @@ class FilterTrim(Filter):
         return value.strip()
 
 
+# Deletion table of the ASCII whitespace characters dropped by ``ignore_spaces``.
+_WS_TABLE = str.maketrans("", "", " \t\r\n\f\v")
+
+
 class FilterIgnoreSpaces(Filter):
+    """Remove all whitespace (spaces, tabs and line breaks)."""
+
     def apply(self, value: str) -> str:
-        return value.replace(" ", "")
+        return value.translate(_WS_TABLE)
 
 
 class FilterReplace(Filter):
@@ -285,12 +379,94 @@ class FilterRegex(Filter):
         self.pattern = pattern
         self.replacement = replacement
         self.flags = flags
-        self.regex = re.compile(pattern, flags or 0)
+        self.regex = _compile_regex(pattern, flags or 0)
 
     def apply(self, value: str) -> str:
         return self.regex.sub(self.replacement, value)
 
 
+# RE2 reads these differently from ``re`` on str: ``$`` never matches before a final
+# newline (unless multiline) and the class escapes are ASCII-only (unless re.ASCII).
+_RE2_END_ANCHOR = re.compile(r"\$")
+_RE2_CLASS_ESCAPE = re.compile(r"\\[dDwWsSbB]")
+_RE2_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.ASCII
+
+
+def _re2_compile(pattern: str, flags: int) -> Any:
+    """Compile ``pattern`` with RE2, or return ``None`` where it would not behave like ``re``."""
+
+    if flags & ~_RE2_FLAGS:
+        return None
+    if not flags & re.MULTILINE and _RE2_END_ANCHOR.search(pattern):
+        return None
+    if not flags & re.ASCII and _RE2_CLASS_ESCAPE.search(pattern):
+        return None
+    options = re2.Options()
+    options.log_errors = False
+    options.case_sensitive = not flags & re.IGNORECASE
+    options.dot_nl = bool(flags & re.DOTALL)
+    if flags & re.MULTILINE:
+        # Options has no multiline switch outside POSIX syntax: use the inline flag.
+        pattern = "(?m)" + pattern
+    try:
+        return re2.compile(pattern, options)
+    except re2.error:  # backreferences, lookarounds, ...
+        return None
+
+
+@lru_cache(maxsize=512)
+def _compile_regex(pattern: str, flags: int) -> Any:
+    """
+    Compile ``pattern`` once per ``(pattern, flags)``: identical filters share it.
+
+    RE2 is used when installed (``baygon[re2]``): matching time is linear in the
+    input, so a pathological output cannot stall the run. Patterns RE2 rejects
+    (backreferences, lookarounds) or would match differently (``$``, ``\\d``,
+    ``\\w``, ``\\s``, ``\\b`` without the flags that align them, ``re.VERBOSE``)
+    fall back to :mod:`re`.
+    """
+
+    if re2 is not None:
+        compiled = _re2_compile(pattern, flags)
+        if compiled is not None:
+            return compiled
+    return re.compile(pattern, flags)
+
+
+# ``iter(...)`` calls get a ``ctx`` argument so each expression keeps its own iterator.
+_ITER_CALL = re.compile(r"((?<=\b)iter\(.*?)(\))")
+
+
+# Expressions made of these only always evaluate to the same immutable value.
+_PURE_NODES = (
+    ast.Expression, ast.Constant, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp,
+    ast.Tuple, ast.Call, ast.keyword, ast.Name, ast.Load,
+    ast.operator, ast.unaryop, ast.boolop, ast.cmpop,
+)
+_PURE_NAMES = frozenset(name for name in vars(math) if not name.startswith("_"))
+
+
+@lru_cache(maxsize=1024)
+def _is_pure_expression(code: str) -> bool:
+    """Tell whether ``code`` only combines literals with :mod:`math` names (``2 * pi``)."""
+
+    try:
+        tree = ast.parse(code.strip(), mode="eval")
+    except SyntaxError:
+        return False
+    for node in ast.walk(tree):
+        if not isinstance(node, _PURE_NODES):
+            return False
+        if isinstance(node, ast.Name) and node.id not in _PURE_NAMES:
+            return False
+    return True
+
+
+@lru_cache(maxsize=64)
+def _mustache_regex(start: str, end: str) -> re.Pattern[str]:
+    return re.compile(f"{re.escape(start)}(.*?){re.escape(end)}")
+
+
 class FilterEval(Filter):
     def __init__(
         self,
@@ -301,29 +477,35 @@ class FilterEval(Filter):
         input: bool = False,
     ) -> None:
         super().__init__(input=input)
-        self._mustache = re.compile(f"{re.escape(start)}(.*?){re.escape(end)}")
+        self._mustache = _mustache_regex(start, end)
         self._kernel = TinyKernel()
+        self._results: dict[str, Any] = {}
         bootstrap = [*list(init or []), "from math import *", "from random import *", "from statistics import *", "from baygon.eval import iter"]
         for statement in bootstrap:
             self._kernel(statement)
 
     def apply(self, value: str) -> str:
-        position = 0
-        result = []
-        for match in self._mustache.finditer(value):
-            result.append(value[position : match.start()])
-            result.append(str(self.exec(match.group(1))))
-            position = match.end()
-        result.append(value[position:])
-        return "".join(result)
+        return self._mustache.sub(self._substitute, value)
+
+    def _substitute(self, match: re.Match[str]) -> str:
+        return str(self.exec(match.group(1)))
 
     def exec(self, code: str) -> Any:
-        code = re.sub(r"((?<=\b)iter\(.*?)(\))", fr"\1,ctx={hash(code)}\2", code)
+        pure = _is_pure_expression(code)
+        if not pure:
+            # Any other code may rebind a math name (``pi = 3``): forget what was memoized.
+            self._results.clear()
+        elif code in self._results:
+            return self._results[code]
+        source = _ITER_CALL.sub(fr"\1,ctx={hash(code)}\2", code)
         try:
-            self._kernel("_ = " + code)
-            return self._kernel.glb["_"]
+            self._kernel("_ = " + source)
+            result = self._kernel.glb["_"]
         except SyntaxError:
-            return self._kernel(code)
+            return self._kernel(source)
+        if pure:
+            self._results[code] = result
+        return result
 
     def __repr__(self) -> str:  # pragma: no cover - repr helper
         return f"{self.__class__.__name__}({self._mustache.pattern!r})"
@@ -359,6 +541,46 @@ class FilterMapEval(Filter):
         return f"{self.__class__.__name__}({self.expr!r})"
 
 
+# Builtin filters that are a single ``str`` method call, as fused by ``Filters``.
+_FUSABLE_FILTERS: dict[type[Filter], str] = {
+    FilterUppercase: ".upper()",
+    FilterLowercase: ".lower()",
+    FilterTrim: ".strip()",
+    FilterIgnoreSpaces: ".translate(_WS_TABLE)",
+}
+
+
+@lru_cache(maxsize=64)
+def _fuse(fragments: tuple[str, ...]) -> Callable[[str], str]:
+    """Compile ``value.upper().strip()``-like chains into one function."""
+
+    return eval(compile(f"lambda value: value{''.join(fragments)}", "<fused>", "eval"))
+
+
+# Below three single character replacements, chained ``str.replace`` beats ``translate``.
+_MIN_TRANSLATE_RUN = 3
+
+
+def _translate_table(filters: Iterable[Filter]) -> dict[int, str]:
+    """
+    Merge single character :class:`FilterReplace` filters into one translation table.
+
+    Each filter maps one character to another, so applying them in turn is the
+    composition of those maps, computed here per character.
+    """
+
+    rules = [(item.pattern, item.replacement) for item in filters]  # type: ignore[attr-defined]
+    table: dict[int, str] = {}
+    for char in {char for rule in rules for char in rule}:
+        image = char
+        for pattern, replacement in rules:
+            if image == pattern:
+                image = replacement
+        if image != char:
+            table[ord(char)] = image
+    return table
+
+
 # Flag mapping for FilterRegex string flags -> re flags
 _REGEX_FLAGS: dict[str, int] = {
     "i": re.IGNORECASE,
@@ -8,11 +8,9 @@ mutate the current identifier as we enter/leave nested groups of tests.
 
 from __future__ import annotations
 
-import re
 from collections.abc import Iterable, Iterator, Sequence
-from typing import Any, Callable
-
-_VALID_ID = re.compile(r"\d+(?:\.\d+)*$")
+from typing import Any, Callable, ClassVar
+from weakref import WeakValueDictionary
 
 
 class TestId(Sequence[int]):
@@ -22,12 +20,47 @@ class TestId(Sequence[int]):
     ``TestId`` exposes a ``Sequence`` interface which means it can be iterated over or converted to
     other container types (``tuple(id)`` or ``list(id)``). A handful of convenience helpers make it
     straightforward to walk up and down a tree of tests while keeping a predictable numbering
-    scheme. Instances are immutable; any operation returns a new ``TestId``.
+    scheme. Instances are immutable; any operation returns a new ``TestId``, and equal
+    identifiers alive at the same time are the very same object.
     """
 
-    __slots__ = ("_parts",)
-
-    def __init__(self, value: Iterable[int] | int | str | TestId | None = None) -> None:
+    __slots__ = ("__weakref__", "_hash", "_parts", "_str")
+
+    #: Live instances by parts: equal identifiers share a single object (flyweight).
+    _pool: ClassVar[WeakValueDictionary[tuple[int, ...], TestId]] = WeakValueDictionary()
+
+    _parts: tuple[int, ...]
+    # Formatting and hashing are computed on first use, then kept.
+    _str: str | None
+    _hash: int | None
+
+    def __new__(cls, value: Iterable[int] | int | str | TestId | None = None) -> TestId:
+        if type(value) is cls:
+            return value
+        parts = cls._coerce_parts(value)
+        if cls is not TestId:
+            return cls._create(parts)
+        return cls._from_parts(parts)
+
+    @classmethod
+    def _from_parts(cls, parts: tuple[int, ...]) -> TestId:
+        """Return the identifier for already validated ``parts`` (internal callers)."""
+
+        instance = cls._pool.get(parts)
+        if instance is None:
+            instance = cls._pool[parts] = cls._create(parts)
+        return instance
+
+    @classmethod
+    def _create(cls, parts: tuple[int, ...]) -> TestId:
+        instance = super().__new__(cls)
+        instance._parts = parts
+        instance._str = None
+        instance._hash = None
+        return instance
+
+    @staticmethod
+    def _coerce_parts(value: Iterable[int] | int | str | TestId | None) -> tuple[int, ...]:
         parts: tuple[int, ...]
 
         if value is None:
@@ -37,9 +70,11 @@ class TestId(Sequence[int]):
         elif isinstance(value, int):
             parts = (value,)
         elif isinstance(value, str):
-            if not _VALID_ID.fullmatch(value):
+            chunks = value.split(".")
+            # isdecimal() rejects what int() would tolerate: signs, spaces, underscores.
+            if not all(chunk.isdecimal() for chunk in chunks):
                 raise ValueError(f"Invalid identifier string: {value!r}")
-            parts = tuple(int(chunk) for chunk in value.split("."))
+            parts = tuple(map(int, chunks))
         else:
             try:
                 parts = tuple(int(chunk) for chunk in value)  # type: ignore[arg-type]
@@ -55,7 +90,7 @@ class TestId(Sequence[int]):
             if chunk < 1:
                 raise ValueError("Identifier parts must be positive integers")
 
-        self._parts = parts
+        return parts
 
     # ------------------------------------------------------------------
     # Navigation helpers
@@ -69,7 +104,7 @@ class TestId(Sequence[int]):
         if step < 1:
             raise ValueError("step must be a positive integer")
         parts = (*self._parts[:-1], self._parts[-1] + step)
-        return TestId(parts)
+        return TestId._from_parts(parts)
 
     def down(self, start: int = 1) -> TestId:
         """Return a new identifier nested one level deeper."""
@@ -78,14 +113,14 @@ class TestId(Sequence[int]):
             raise TypeError("start must be an integer")
         if start < 1:
             raise ValueError("start must be a positive integer")
-        return TestId((*self._parts, start))
+        return TestId._from_parts((*self._parts, start))
 
     def up(self) -> TestId:
         """Return the parent identifier (or itself if already at the root)."""
 
         if len(self._parts) == 1:
             return self
-        return TestId(self._parts[:-1])
+        return TestId._from_parts(self._parts[:-1])
 
     # ------------------------------------------------------------------
     # Sequence protocol
@@ -105,13 +140,17 @@ class TestId(Sequence[int]):
     # ------------------------------------------------------------------
 
     def __str__(self) -> str:
-        return ".".join(str(part) for part in self._parts)
+        if self._str is None:
+            self._str = ".".join(map(str, self._parts))
+        return self._str
 
     def __repr__(self) -> str:  # pragma: no cover - repr is simple
         return f"TestId({str(self)})"
 
     def __hash__(self) -> int:  # pragma: no cover - tuple hashing
-        return hash(self._parts)
+        if self._hash is None:
+            self._hash = hash(self._parts)
+        return self._hash
 
     def __eq__(self, other: object) -> bool:  # pragma: no cover - trivial
         if isinstance(other, TestId):
@@ -120,6 +159,17 @@ class TestId(Sequence[int]):
             return tuple(self._parts) == tuple(other)
         return NotImplemented
 
+    # Copies and unpickled values go back through ``__new__`` so they land in the pool;
+    # the default protocols would call ``__new__(cls)`` and overwrite the pooled root.
+    def __reduce__(self) -> tuple[type[TestId], tuple[tuple[int, ...]]]:
+        return (type(self), (self._parts,))
+
+    def __copy__(self) -> TestId:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> TestId:
+        return self
+
     def __add__(self, value: int) -> TestId:
         """Alias for :meth:`next` so ``id + 1`` works naturally."""
 
@@ -4,23 +4,42 @@ This module provides a minimal I/O layer for the "baygon" DSL. It can
 load text or files and convert them to Python objects by trying the JSON
 and YAML parsers in sequence. Syntax errors are collected so a CLI can
 display them in a user-friendly way.
+
+The C accelerated parsers are used when installed: libyaml's ``CSafeLoader``
+and ``orjson``, falling back to PyYAML's ``SafeLoader`` and :mod:`json`.
 """
 
 from __future__ import annotations
 
-import json
 import errno
+import json
+import os
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterator, Literal
 
-from yaml import YAMLError, safe_load
+from yaml import YAMLError, load as yaml_load
+
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # pragma: no cover - pure Python fallback
+    from yaml import SafeLoader as _YAMLLoader  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional faster JSON parser
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
 
 Format = Literal["auto", "json", "yaml"]
 
 _SEARCH_PREFIXES: tuple[str, ...] = ("baygon", "test", "tests")
 _SEARCH_EXTENSIONS: tuple[str, ...] = (".yaml", ".yml", ".json")
+_PREFIX_RANK: dict[str, int] = {prefix: i for i, prefix in enumerate(_SEARCH_PREFIXES)}
+_EXT_RANK: dict[str, int] = {ext: i for i, ext in enumerate(_SEARCH_EXTENSIONS)}
+# First non-blank character of a JSON document: object, array, string, number, literal.
+_JSON_START = frozenset('{["-0123456789tfn')
 
 
 @dataclass(slots=True)
@@ -59,18 +78,46 @@ class ConfigSyntaxError(Exception):
         super().__init__("\n".join(issue.to_message() for issue in self.issues))
 
 
-def _iter_search_directories(start: Path) -> Iterator[Path]:
+def _iter_search_directories(start: str) -> Iterator[str]:
+    # Plain strings and os.path: no Path object is built per level.
     current = start
     while True:
         yield current
-        if (current / ".git").exists():
+        if os.path.exists(os.path.join(current, ".git")):
             break
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
             break
         current = parent
 
 
+def _best_candidate(directory: str) -> Path | None:
+    """
+    Return the preferred configuration file directly inside ``directory``.
+
+    Files rank by prefix, then extension (both in declaration order), then name.
+    The directory is listed once; only the current best candidate is stat'ed.
+    """
+
+    best: tuple[int, int, str] | None = None
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                ext_rank = _EXT_RANK.get(os.path.splitext(name)[1])
+                if ext_rank is None or not name.startswith(_SEARCH_PREFIXES):
+                    continue
+                prefix_rank = next(
+                    rank for prefix, rank in _PREFIX_RANK.items() if name.startswith(prefix)
+                )
+                rank = (prefix_rank, ext_rank, name)
+                if (best is None or rank < best) and entry.is_file():
+                    best = rank
+    except OSError:
+        return None
+    return None if best is None else Path(directory, best[2])
+
+
 def _format_not_found(message: str, *, filename: str | None = None) -> FileNotFoundError:
     return FileNotFoundError(errno.ENOENT, message, filename)
 
@@ -97,9 +144,26 @@ def locate_config_file(
     start_dir:
         Directory where the search starts. Defaults to the current working
         directory.
+
+    Results are cached per ``(name, start_dir)``; a cached path that no longer
+    exists triggers a new search. Call ``locate_config_file.cache_clear()``
+    after creating configuration files, or set ``BAYGON_DISABLE_CACHE`` to
+    always search.
     """
 
-    start_dir = (start_dir or Path.cwd()).resolve()
+    start = os.fspath((start_dir or Path.cwd()).resolve())
+    key = None if name is None else os.fspath(name)
+    if os.environ.get("BAYGON_DISABLE_CACHE"):
+        return _locate_config_file(key, start)
+    found = _locate_config_file_cached(key, start)
+    if not found.is_file():
+        _locate_config_file_cached.cache_clear()
+        found = _locate_config_file_cached(key, start)
+    return found
+
+
+def _locate_config_file(name: str | None, start: str) -> Path:
+    start_dir = Path(start)
 
     candidate: Path | None = None
     target_name: str | None = None
@@ -122,26 +186,25 @@ def locate_config_file(
 
         target_name = candidate.name
 
-    search_directories = tuple(_iter_search_directories(start_dir))
+    search_directories = tuple(_iter_search_directories(start))
 
     if target_name:
+        has_suffix = bool(candidate.suffix)
         for directory in search_directories:
-            potential = directory / target_name
-            if potential.is_file():
-                return potential
-            if Path(target_name).suffix:
+            potential = os.path.join(directory, target_name)
+            if os.path.isfile(potential):
+                return Path(potential)
+            if has_suffix:
                 continue
             for extension in _SEARCH_EXTENSIONS:
-                potential_with_ext = directory / f"{target_name}{extension}"
-                if potential_with_ext.is_file():
-                    return potential_with_ext
+                potential_with_ext = potential + extension
+                if os.path.isfile(potential_with_ext):
+                    return Path(potential_with_ext)
 
     for directory in search_directories:
-        for prefix in _SEARCH_PREFIXES:
-            for extension in _SEARCH_EXTENSIONS:
-                for path in sorted(directory.glob(f"{prefix}*{extension}")):
-                    if path.is_file():
-                        return path
+        found = _best_candidate(directory)
+        if found is not None:
+            return found
 
     if name is None:
         message = f"Could not locate a configuration file starting from '{start_dir}'."
@@ -150,6 +213,10 @@ def locate_config_file(
     raise _format_not_found(message, filename=str(name) if name else None)
 
 
+_locate_config_file_cached = lru_cache(maxsize=128)(_locate_config_file)
+locate_config_file.cache_clear = _locate_config_file_cached.cache_clear  # type: ignore[attr-defined]
+
+
 def _format_json_issue(source: str | None, err: json.JSONDecodeError) -> SyntaxIssue:
     hint = None
     message = err.msg
@@ -197,6 +264,17 @@ def _format_yaml_issue(source: str | None, err: YAMLError) -> SyntaxIssue:
     )
 
 
+def _parse_json(text: str) -> Any:
+    try:
+        return _json_loads(text)
+    except ValueError:
+        if _json_loads is json.loads:
+            raise
+    # The stdlib parser reports the error details users are shown, and accepts
+    # the few documents orjson refuses (NaN, integers beyond 64 bits).
+    return json.loads(text)
+
+
 def load_text(text: str, *, source: str | None = None, format: Format = "auto") -> Any:
     """Load JSON or YAML text.
 
@@ -207,32 +285,44 @@ def load_text(text: str, *, source: str | None = None, format: Format = "auto")
     source:
         File name or stream identifier, only used for error messages.
     format:
-        "json", "yaml" or "auto" to try both.
+        "json", "yaml" or "auto" to try both, starting with the one the first
+        character points to.
     """
 
-    errors: list[SyntaxIssue] = []
-
-    def _should_try(fmt: Format, target: Literal["json", "yaml"]) -> bool:
-        return fmt == target or fmt == "auto"
-
-    if _should_try(format, "json"):
+    if format == "json":
         try:
-            return json.loads(text)
-        except json.JSONDecodeError as exc:  # pragma: no cover - info branch
-            errors.append(_format_json_issue(source, exc))
-            if format == "json":
-                raise ConfigSyntaxError(errors) from exc
-
-    if _should_try(format, "yaml"):
+            return _parse_json(text)
+        except json.JSONDecodeError as exc:
+            raise ConfigSyntaxError([_format_json_issue(source, exc)]) from exc
+    if format == "yaml":
         try:
-            return safe_load(text)
+            return yaml_load(text, Loader=_YAMLLoader)
         except YAMLError as exc:
-            errors.append(_format_yaml_issue(source, exc))
+            raise ConfigSyntaxError([_format_yaml_issue(source, exc)]) from exc
+    if format != "auto":
+        raise ValueError(f"Unknown format: {format}")
+
+    # Only a JSON document can start with one of these: trying JSON on YAML
+    # would scan up to its first syntax error for nothing.
+    if text.lstrip()[:1] in _JSON_START:
+        parsers: tuple[Literal["json", "yaml"], ...] = ("json", "yaml")
+    else:
+        parsers = ("yaml", "json")
 
-    if errors:
-        raise ConfigSyntaxError(errors)
+    errors: list[SyntaxIssue] = []
+    for parser in parsers:
+        if parser == "json":
+            try:
+                return _parse_json(text)
+            except json.JSONDecodeError as exc:  # pragma: no cover - info branch
+                errors.append(_format_json_issue(source, exc))
+        else:
+            try:
+                return yaml_load(text, Loader=_YAMLLoader)
+            except YAMLError as exc:
+                errors.append(_format_yaml_issue(source, exc))
 
-    raise ValueError(f"Unknown format: {format}")
+    raise ConfigSyntaxError(errors)
 
 
 def load_file(
@@ -253,8 +343,29 @@ def load_file(
         elif suffix in {".yml", ".yaml"}:
             format = "yaml"
 
-    text = resolved_path.read_text(encoding=encoding)
-    return load_text(text, source=str(resolved_path), format=format)
+    utf8 = encoding.lower().replace("-", "") == "utf8"
+    if format == "yaml" and utf8:
+        return _load_yaml_file(resolved_path)
+
+    with open(resolved_path, "rb") as stream:
+        raw = stream.read()
+    if format == "json" and utf8:
+        # Both JSON parsers take UTF-8 bytes; only decode to report an error.
+        try:
+            return _json_loads(raw)
+        except ValueError:
+            pass
+    return load_text(raw.decode(encoding), source=str(resolved_path), format=format)
+
+
+def _load_yaml_file(path: Path) -> Any:
+    """Let the YAML parser read ``path`` itself rather than building a ``str`` first."""
+
+    with path.open("rb") as stream:
+        try:
+            return yaml_load(stream, Loader=_YAMLLoader)
+        except YAMLError as exc:
+            raise ConfigSyntaxError([_format_yaml_issue(str(path), exc)]) from exc
 
 
 __all__ = ["ConfigSyntaxError", "SyntaxIssue", "load_file", "load_text", "locate_config_file"]
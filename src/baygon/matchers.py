@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import codecs
 import inspect
 import re
+import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Iterator, MutableMapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from functools import cache, lru_cache
+from types import CodeType
 from typing import Any, ClassVar
 
 from pydantic import BaseModel, create_model
 
-from .filters import TinyKernel
+from .filters import TinyKernel, _camel_to_snake
+from .schema import CheckBase, parse_check
 
 __all__ = [
     "Matcher",
@@ -38,35 +43,104 @@ __all__ = [
 ]
 
 
-def _camel_to_snake(name: str) -> str:
-    parts = []
-    for index, char in enumerate(name):
-        if char.isupper() and index and (
-            not name[index - 1].isupper()
-            or (index + 1 < len(name) and name[index + 1].islower())
-        ):
-            parts.append("_")
-        parts.append(char.lower())
-    return "".join(parts)
-
-
 def _normalize_pattern(pattern: str) -> str:
+    if "\\" not in pattern:
+        return pattern
+    # Non-Latin-1 text becomes escapes unicode_escape turns back into the same characters;
+    # decoding the str itself would go through UTF-8 and mangle it (``é`` → ``Ã©``).
+    raw = pattern.encode("latin-1", "backslashreplace")
     try:
-        return pattern.encode("utf-8").decode("unicode_escape")
+        with warnings.catch_warnings():
+            # Regex escapes (``\d``, ``\w``...) are meant to pass through unchanged.
+            warnings.simplefilter("ignore", DeprecationWarning)
+            return codecs.decode(raw, "unicode_escape")
     except UnicodeDecodeError:  # pragma: no cover - defensive
         return pattern
 
 
+@lru_cache(maxsize=64)
+def _parse_flags(flags: int | str | None) -> int | None:
+    """Turn ``"im"``-style flag letters into ``re`` flags (integers pass through)."""
+
+    if not isinstance(flags, str):
+        return flags
+    flag_value = 0
+    for char in flags:
+        flag_value |= _REGEX_FLAGS.get(char.lower(), 0)
+    return flag_value or None
+
+
+@lru_cache(maxsize=512)
+def _compile_regex(regex: str, flags: int) -> re.Pattern[str]:
+    """Normalize and compile ``regex``; matchers with the same pattern share the result."""
+
+    return re.compile(_normalize_pattern(regex), flags)
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expr: str) -> tuple[CodeType, bool] | None:
+    """
+    Compile a ``check_eval`` expression once, as ``TinyKernel`` would run it.
+
+    Returns ``(code, is_eval)``: ``_ = expr`` when ``expr`` is an expression,
+    otherwise ``expr`` itself, or ``None`` when it is not valid Python.
+    """
+
+    try:
+        return compile("_ = " + expr, "<tinykernel>", "exec"), False
+    except SyntaxError:
+        pass
+    try:
+        return compile(expr, "<tinykernel>", "eval"), True
+    except SyntaxError:
+        pass
+    try:
+        return compile(expr, "<tinykernel>", "exec"), False
+    except SyntaxError:
+        return None
+
+
+class _LazyDetails:
+    """Holds the callable rendering ``MatcherError.details``, outside the dataclass fields."""
+
+    __slots__ = ("_render",)
+
+
 @dataclass(slots=True)
-class MatcherError:
-    """Failure reported by a matcher."""
+class MatcherError(_LazyDetails):
+    """
+    Failure reported by a matcher.
+
+    ``details`` may be given as a callable: the message is then only formatted
+    (and cached) the first time it is read, so failures that are never shown do
+    not pay for ``repr`` of large outputs. Everything else (equality, ``repr``,
+    ``dataclasses.replace``/``asdict``, pickling) sees the rendered message.
+    """
 
     value: Any
     expected: Any
     on: str | None = None
     check: str | None = None
     explain: str | None = None
-    details: str | None = None
+    details: str | Callable[[], str] | None = None
+
+    def __post_init__(self) -> None:
+        details = self.details
+        if callable(details):
+            self._render = details
+            del self.details  # left unset until ``__getattr__`` renders it
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots: ``details`` waiting for its first read.
+        if name != "details":
+            raise AttributeError(name)
+        render = self._render
+        del self._render
+        details = self.details = render()
+        return details
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (self.value, self.expected, self.on, self.check, self.explain, self.details))
 
     def _suffix(self) -> str:
         if self.explain:
@@ -82,26 +156,37 @@ class Matcher(ABC):
     """Base matcher interface."""
 
     registry_name: ClassVar[str | None] = None
+    #: Model built by :meth:`schema_model`, stored on each class separately.
+    _schema_cache: ClassVar[type[BaseModel] | None] = None
+    #: Canonical registry name, resolved when the subclass is created.
+    _registry_name: ClassVar[str] = ""
+    #: Whether the matcher only looks at ``str(value)``.
+    text_input: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._registry_name = cls.registry_name or _camel_to_snake(cls.__name__.removeprefix("Match"))
 
     def __init__(self, *, inverse: bool = False, explain: str | None = None) -> None:
-        self.inverse = inverse
+        self.inverse = bool(inverse)
         self.explain = explain
 
     @classmethod
     def name(cls) -> str:
-        if cls.registry_name:
-            return cls.registry_name
-        name = cls.__name__
-        if name.startswith("Match"):
-            name = name[len("Match") :]
-        return _camel_to_snake(name)
+        return cls._registry_name
 
     @classmethod
+    @cache
     def signature(cls) -> inspect.Signature:
         return inspect.signature(cls.__init__)
 
     @classmethod
     def schema_model(cls) -> type[BaseModel]:
+        # Read the class' own dict: a subclass must not reuse its parent's model.
+        cached = cls.__dict__.get("_schema_cache")
+        if cached is not None:
+            return cached
+
         fields: dict[str, tuple[Any, Any]] = {}
         signature = cls.signature()
         for name, param in signature.parameters.items():
@@ -115,22 +200,37 @@ class Matcher(ABC):
             default = param.default if param.default is not inspect._empty else ...
             fields[name] = (annotation, default)
         model_name = f"{cls.__name__}Config"
-        return create_model(model_name, **fields)  # type: ignore[arg-type]
+        model = create_model(model_name, **fields)  # type: ignore[arg-type]
+        cls._schema_cache = model
+        return model
 
     def __call__(self, value: Any, **context: Any) -> MatcherError | None:
-        success = self._matches(value, **context)
-        if self.inverse:
-            success = not success
-        if success:
+        return self.evaluate(value, context)
+
+    def evaluate(
+        self, value: Any, context: Mapping[str, Any] | None = None, text: str | None = None
+    ) -> MatcherError | None:
+        """
+        Check ``value``; ``context`` is passed along as-is instead of re-packed.
+
+        ``text`` is ``str(value)`` when the caller already has it: ``text_input`` matchers
+        compare it instead of ``value``, failures still report the original ``value``.
+        """
+
+        if context is None:
+            context = {}
+        subject = text if text is not None and self.text_input else value
+        if bool(self._matches(subject, context)) is not self.inverse:
             return None
-        return self._failure(value, **context)
+        # ``on``/``test`` are only looked up once something has to be reported.
+        return self._failure(value, context.get("on"), context.get("test"))
 
     @abstractmethod
-    def _matches(self, value: Any, **context: Any) -> bool:
+    def _matches(self, value: Any, context: Mapping[str, Any]) -> bool:
         """Return ``True`` if the value satisfies the matcher."""
 
     @abstractmethod
-    def _failure(self, value: Any, **context: Any) -> MatcherError:
+    def _failure(self, value: Any, on: str | None, check: str | None) -> MatcherError:
         """Return the failure description for ``value``."""
 
 
@@ -138,49 +238,47 @@ class MatchRegex(Matcher):
     """Regex based matcher."""
 
     registry_name = "match"
+    text_input = True
 
     def __init__(self, regex: str, flags: int | str | None = None, **kwargs: Any) -> None:
-        if isinstance(flags, str):
-            flag_value = 0
-            for char in flags:
-                flag_value |= _REGEX_FLAGS.get(char.lower(), 0)
-            flags = flag_value or None
+        flags = _parse_flags(flags)
         self.pattern = regex
         self.flags = flags
-        normalized = _normalize_pattern(regex)
-        self.regex = re.compile(normalized, flags or 0)
+        self.regex = _compile_regex(regex, flags or 0)
         super().__init__(**kwargs)
 
-    def _matches(self, value: Any, **context: Any) -> bool:
+    def _matches(self, value: Any, context: Mapping[str, Any]) -> bool:
         string = str(value)
         return self.regex.search(string) is not None
 
-    def _failure(self, value: Any, **context: Any) -> MatcherError:
-        on = context.get("on")
-        check = context.get("test")
-        details = (
-            f"Output '{on or 'value'}' does not match /{self.pattern}/"
-            f" on {value!r}"
-        )
-        return MatcherError(value=value, expected=self.pattern, on=on, check=check, explain=self.explain, details=details)
+    def _failure(self, value: Any, on: str | None, check: str | None) -> MatcherError:
+        def message() -> str:
+            return (
+                f"Output '{on or 'value'}' does not match /{self.pattern}/"
+                f" on {value!r}"
+            )
+
+        return MatcherError(value=value, expected=self.pattern, on=on, check=check, explain=self.explain, details=message)
 
 
 class MatchContains(Matcher):
+    text_input = True
+
     def __init__(self, value: str, **kwargs: Any) -> None:
         self.expected = value
         super().__init__(**kwargs)
 
-    def _matches(self, value: Any, **context: Any) -> bool:
+    def _matches(self, value: Any, context: Mapping[str, Any]) -> bool:
         string = str(value)
         return self.expected in string
 
-    def _failure(self, value: Any, **context: Any) -> MatcherError:
-        on = context.get("on")
-        check = context.get("test")
-        message = (
-            f"Output {on or 'value'} does not contain {self.expected!r}. "
-            f"Found {value!r} instead."
-        )
+    def _failure(self, value: Any, on: str | None, check: str | None) -> MatcherError:
+        def message() -> str:
+            return (
+                f"Output {on or 'value'} does not contain {self.expected!r}. "
+                f"Found {value!r} instead."
+            )
+
         return MatcherError(value=value, expected=self.expected, on=on, check=check, explain=self.explain, details=message)
 
 
@@ -190,29 +288,31 @@ class MatchNotContains(MatchContains):
     def __init__(self, value: str, **kwargs: Any) -> None:
         super().__init__(value=value, inverse=True, **kwargs)
 
-    def _failure(self, value: Any, **context: Any) -> MatcherError:
-        on = context.get("on")
-        check = context.get("test")
-        message = (
-            f"Output {on or 'value'} unexpectedly contains {self.expected!r}."
-        )
+    def _failure(self, value: Any, on: str | None, check: str | None) -> MatcherError:
+        def message() -> str:
+            return (
+                f"Output {on or 'value'} unexpectedly contains {self.expected!r}."
+            )
+
         return MatcherError(value=value, expected=self.expected, on=on, check=check, explain=self.explain, details=message)
 
 
 class MatchEquals(Matcher):
+    text_input = True
+
     def __init__(self, value: str, **kwargs: Any) -> None:
         self.expected = value
         super().__init__(**kwargs)
 
-    def _matches(self, value: Any, **context: Any) -> bool:
+    def _matches(self, value: Any, context: Mapping[str, Any]) -> bool:
         return str(value) == self.expected
 
-    def _failure(self, value: Any, **context: Any) -> MatcherError:
-        on = context.get("on")
-        check = context.get("test")
-        message = (
-            f"Output {value!r} does not equal {self.expected!r} on {on or 'value'}."
-        )
+    def _failure(self, value: Any, on: str | None, check: str | None) -> MatcherError:
+        def message() -> str:
+            return (
+                f"Output {value!r} does not equal {self.expected!r} on {on or 'value'}."
+            )
+
         return MatcherError(value=value, expected=self.expected, on=on, check=check, explain=self.explain, details=message)
 
 
@@ -222,12 +322,12 @@ class MatchNotEquals(MatchEquals):
     def __init__(self, value: str, **kwargs: Any) -> None:
         super().__init__(value=value, inverse=True, **kwargs)
 
-    def _failure(self, value: Any, **context: Any) -> MatcherError:
-        on = context.get("on")
-        check = context.get("test")
-        message = (
-            f"Output {on or 'value'} unexpectedly equals {self.expected!r}."
-        )
+    def _failure(self, value: Any, on: str | None, check: str | None) -> MatcherError:
+        def message() -> str:
+            return (
+                f"Output {on or 'value'} unexpectedly equals {self.expected!r}."
+            )
+
         return MatcherError(value=value, expected=self.expected, on=on, check=check, explain=self.explain, details=message)
 
 
@@ -236,42 +336,27 @@ class _NumberMatcher(Matcher):
 
     def __init__(self, value: float, **kwargs: Any) -> None:
         self.threshold = float(value)
-        self._actual: float | None = None
-        self._coerce_error: str | None = None
         super().__init__(**kwargs)
 
-    def _coerce(self, value: Any) -> float | None:
+    def _matches(self, value: Any, context: Mapping[str, Any]) -> bool:
         try:
-            number = float(value)
+            return self._compare(float(value))
         except (TypeError, ValueError):
-            self._coerce_error = f"cannot convert {value!r} to float"
-            self._actual = None
-            return None
-        self._coerce_error = None
-        self._actual = number
-        return number
-
-    def _matches(self, value: Any, **context: Any) -> bool:
-        number = self._coerce(value)
-        if number is None:
             return False
-        return self._compare(number)
 
     @abstractmethod
     def _compare(self, number: float) -> bool:
         ...
 
-    def _failure(self, value: Any, **context: Any) -> MatcherError:
-        on = context.get("on")
-        check = context.get("test")
-        if self._coerce_error:
-            message = (
-                f"Output {on or 'value'} {self._coerce_error}."
-            )
-        else:
-            message = (
-                f"Output {on or 'value'} ({self._actual!r}) is not {self.comparator} {self.threshold!r}."
-            )
+    def _failure(self, value: Any, on: str | None, check: str | None) -> MatcherError:
+        def message() -> str:
+            # Failures are the cold path: convert again rather than keeping state around.
+            try:
+                actual = float(value)
+            except (TypeError, ValueError):
+                return f"Output {on or 'value'} cannot convert {value!r} to float."
+            return f"Output {on or 'value'} ({actual!r}) is not {self.comparator} {self.threshold!r}."
+
         return MatcherError(
             value=value,
             expected=self.threshold,
@@ -321,31 +406,38 @@ class MatchEval(Matcher):
         self._kernel = TinyKernel()
         for statement in init or []:
             self._kernel(statement)
+        self._code = _compile_expression(expr)
+
+    def _matches(self, value: Any, context: Mapping[str, Any]) -> bool:
+        glb = self._kernel.glb
+        namespace = context.get("namespace")
+        if namespace:
+            glb.update(namespace)
+        glb["value"] = value
+        glb["actual"] = value
+        if self._code is None:
+            # Not valid Python: let the kernel raise the syntax error as usual.
+            return bool(self._kernel(self.expr))
+        code, is_eval = self._code
+        if is_eval:
+            return bool(eval(code, glb, glb))
+        exec(code, glb, glb)
+        return bool(glb.get("_"))
+
+    def _failure(self, value: Any, on: str | None, check: str | None) -> MatcherError:
+        def message() -> str:
+            return (
+                f"Expression {self.expr!r} evaluated to false for {value!r}."
+            )
 
-    def _matches(self, value: Any, **context: Any) -> bool:
-        namespace = context.get("namespace") or {}
-        self._kernel.glb.update(namespace)
-        self._kernel.glb["value"] = value
-        self._kernel.glb["actual"] = value
-        try:
-            self._kernel("_ = " + self.expr)
-            result = self._kernel.glb.get("_")
-        except SyntaxError:
-            result = self._kernel(self.expr)
-        return bool(result)
-
-    def _failure(self, value: Any, **context: Any) -> MatcherError:
-        on = context.get("on")
-        check = context.get("test")
-        message = (
-            f"Expression {self.expr!r} evaluated to false for {value!r}."
-        )
         return MatcherError(value=value, expected=self.expr, on=on, check=check, explain=self.explain, details=message)
 
 
 class MatchCapture(Matcher):
     """Run nested matchers on a regex capture group."""
 
+    text_input = True
+
     def __init__(
         self,
         regex: str,
@@ -356,19 +448,14 @@ class MatchCapture(Matcher):
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
-        if isinstance(flags, str):
-            flag_value = 0
-            for char in flags:
-                flag_value |= _REGEX_FLAGS.get(char.lower(), 0)
-            flags = flag_value or None
+        flags = _parse_flags(flags)
         self.pattern = regex
         self.flags = flags
-        normalized = _normalize_pattern(regex)
-        self.regex = re.compile(normalized, flags or 0)
+        self.regex = _compile_regex(regex, flags or 0)
         self.group = group
         self.tests = Matchers(tests or [])
 
-    def _matches(self, value: Any, **context: Any) -> bool:
+    def _matches(self, value: Any, context: Mapping[str, Any]) -> bool:
         string = str(value)
         self._captured: str | None = None
         self._nested_failure: MatcherError | None = None
@@ -383,17 +470,17 @@ class MatchCapture(Matcher):
         nested_context = dict(context)
         base = context.get("on") or "value"
         nested_context["on"] = f"{base}::capture[{self.group}]"
-        failures = self.tests.evaluate(captured, **nested_context)
+        failures = self.tests.evaluate(captured, nested_context)
         self._nested_failure = failures[0] if failures else None
         return not failures
 
-    def _failure(self, value: Any, **context: Any) -> MatcherError:
-        on = context.get("on")
-        check = context.get("test")
+    def _failure(self, value: Any, on: str | None, check: str | None) -> MatcherError:
         if getattr(self, "_captured", None) is None:
-            message = (
-                f"Regex capture /{self.pattern}/ failed on {on or 'value'} ({value!r})."
-            )
+            def message() -> str:
+                return (
+                    f"Regex capture /{self.pattern}/ failed on {on or 'value'} ({value!r})."
+                )
+
             return MatcherError(
                 value=value,
                 expected=self.pattern,
@@ -404,7 +491,12 @@ class MatchCapture(Matcher):
             )
         if getattr(self, "_nested_failure", None):
             failure = self._nested_failure
-            message = f"Capture group {self.group} failed nested check: {failure.details or failure}"
+
+            def message() -> str:
+                return (
+                    f"Capture group {self.group} failed nested check: {failure.details or failure}"
+                )
+
             return MatcherError(
                 value=self._captured,
                 expected=failure.expected,
@@ -413,9 +505,12 @@ class MatchCapture(Matcher):
                 explain=self.explain,
                 details=message,
             )
-        message = (
-            f"Capture matcher failed for {on or 'value'} ({value!r})."
-        )
+
+        def message() -> str:
+            return (
+                f"Capture matcher failed for {on or 'value'} ({value!r})."
+            )
+
         return MatcherError(
             value=value,
             expected=self.pattern,
@@ -457,54 +552,69 @@ class Matchers(Sequence[Matcher]):
         for matcher in matchers:
             self.append(matcher)
 
-    def evaluate(self, value: Any, **context: Any) -> list[MatcherError]:
+    def evaluate(
+        self, value: Any, context: Mapping[str, Any] | None = None
+    ) -> list[MatcherError]:
+        if context is None:
+            context = {}
         failures: list[MatcherError] = []
+        text: str | None = value if type(value) is str else None
         for matcher in self._matchers:
-            failure = matcher(value, **context)
+            if matcher.text_input and text is None:
+                # Convert once for every string matcher of the chain.
+                text = str(value)
+            failure = matcher.evaluate(value, context, text if matcher.text_input else None)
             if failure is not None:
                 failures.append(failure)
         return failures
 
 
-class MatcherRegistry(MutableMapping[str, type[Matcher]]):
-    """Registry of available matcher classes."""
+class MatcherRegistry(dict[str, type[Matcher]]):
+    """
+    Registry of available matcher classes.
 
-    def __init__(self) -> None:
-        self._storage: dict[str, type[Matcher]] = {}
-
-    def __getitem__(self, key: str) -> type[Matcher]:
-        return self._storage[key]
+    A plain ``dict`` underneath: lookups done for every check stay C-level.
+    Every way of adding entries (item assignment, ``update``, ``setdefault``,
+    ``|=``) is routed through :meth:`register` for validation.
+    """
 
     def __setitem__(self, key: str, value: type[Matcher]) -> None:
         self.register(value, name=key)
 
-    def __delitem__(self, key: str) -> None:
-        del self._storage[key]
+    def update(self, other: Any = (), /, **kwargs: type[Matcher]) -> None:
+        items = other.items() if isinstance(other, Mapping) else other
+        for key, value in items:
+            self.register(value, name=key)
+        for key, value in kwargs.items():
+            self.register(value, name=key)
 
-    def __iter__(self) -> Iterator[str]:
-        return iter(self._storage)
+    def setdefault(self, key: str, default: type[Matcher]) -> type[Matcher]:  # type: ignore[override]
+        if key not in self:
+            self.register(default, name=key)
+        return self[key]
 
-    def __len__(self) -> int:
-        return len(self._storage)
+    def __ior__(self, other: Any) -> MatcherRegistry:  # type: ignore[override]
+        self.update(other)
+        return self
 
     def register(self, matcher_cls: type[Matcher], *, name: str | None = None) -> None:
         if not issubclass(matcher_cls, Matcher):
             raise TypeError("Only Matcher subclasses can be registered")
         key = name or matcher_cls.name()
-        if key in self._storage:
+        if key in self:
             raise TypeError(f"Matcher '{key}' is already registered")
-        self._storage[key] = matcher_cls
+        dict.__setitem__(self, key, matcher_cls)
 
     def create(self, name: str, /, **kwargs: Any) -> Matcher:
         try:
-            matcher_cls = self._storage[name]
+            matcher_cls = self[name]
         except KeyError as exc:
             raise KeyError(f"Unknown matcher '{name}'") from exc
         return matcher_cls(**kwargs)
 
     def model(self, name: str) -> type[BaseModel]:
         try:
-            matcher_cls = self._storage[name]
+            matcher_cls = self[name]
         except KeyError as exc:
             raise KeyError(f"Unknown matcher '{name}'") from exc
         return matcher_cls.schema_model()
@@ -538,8 +648,6 @@ def iter_matchers() -> Iterator[tuple[str, type[Matcher]]]:
 def build_matcher(check: Any) -> Matcher:
     """Create a matcher instance from a :class:`~baygon.schema.CheckBase`."""
 
-    from .schema import CheckBase, parse_check
-
     if isinstance(check, CheckBase):
         kind = check.kind
         payload = check.model_dump(exclude={"kind"})
@@ -548,9 +656,10 @@ def build_matcher(check: Any) -> Matcher:
         payload = {k: v for k, v in check.items() if k != "kind"}
     else:
         return build_matcher(parse_check(check))
-    tests = payload.pop("tests", None)
-    if tests is not None:
-        payload["tests"] = [build_matcher(item) for item in tests]
+    if "tests" in payload:
+        tests = payload.pop("tests")
+        if tests is not None:
+            payload["tests"] = [build_matcher(item) for item in tests]
     return registry.create(kind, **payload)
 
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from copy import deepcopy
 from typing import Any
 
@@ -10,16 +10,34 @@ from pydantic import BaseModel
 
 from .schema import TESTCASE_PROPAGATION, FileSpec, Spec, TestCase
 
+# Exact types: a set lookup on type(item) is cheaper than an isinstance chain.
+_ATOMIC_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
 
-def _clone_items(items: list[Any]) -> list[Any]:
-    """Return a cloned list (``model_copy`` for Pydantic models)."""
 
+def _clone_items(items: Sequence[Any], memo: dict[int, Any] | None = None) -> list[Any]:
+    """
+    Return a cloned list (``model_copy`` for Pydantic models).
+
+    Immutable items (scalars, frozen models such as filters and setup steps) are
+    shared rather than copied. With ``memo`` (``id(original) -> clone``), an item
+    already cloned for a sibling is reused instead of being copied again.
+    """
+
+    if not items:
+        return []
     cloned: list[Any] = []
     for item in items:
-        if isinstance(item, BaseModel):
-            cloned.append(item.model_copy(deep=True))
+        if type(item) in _ATOMIC_TYPES or (
+            isinstance(item, BaseModel) and item.model_config.get("frozen")
+        ):
+            cloned.append(item)
+        elif memo is not None and id(item) in memo:
+            cloned.append(memo[id(item)])
         else:
-            cloned.append(deepcopy(item))
+            clone = item.model_copy(deep=True) if isinstance(item, BaseModel) else deepcopy(item)
+            if memo is not None:
+                memo[id(item)] = clone
+            cloned.append(clone)
     return cloned
 
 
@@ -29,15 +47,20 @@ def _merge_files(
 ) -> dict[str, FileSpec]:
     """Merge file expectations while preserving parent → child order."""
 
-    merged: dict[str, FileSpec] = {
-        name: spec.model_copy(deep=True) for name, spec in parent.items()
-    }
+    # FileSpec models are never mutated: entries are shared, and a new spec is
+    # built (without revalidating already normalized ops) when both sides list ops.
+    if not child:
+        return dict(parent)
+    if not parent:
+        return dict(child)
 
+    merged = dict(parent)
     for name, spec in child.items():
-        if name in merged:
-            merged[name].ops.extend(_clone_items(list(spec.ops)))
+        inherited = merged.get(name)
+        if inherited is None:
+            merged[name] = spec
         else:
-            merged[name] = spec.model_copy(deep=True)
+            merged[name] = FileSpec.model_construct(ops=[*inherited.ops, *spec.ops])
 
     return merged
 
@@ -46,10 +69,10 @@ FieldInitializer = Callable[[Spec], Any]
 
 
 _FIELD_INITIALIZERS: dict[str, FieldInitializer] = {
-    "filters": lambda spec: list(spec.filters),
-    "setup": lambda spec: [],
-    "teardown": lambda spec: [],
-    "args": lambda spec: list(spec.exec.args),
+    "filters": lambda spec: tuple(spec.filters),
+    "setup": lambda spec: (),
+    "teardown": lambda spec: (),
+    "args": lambda spec: tuple(spec.exec.args),
     "stdin": lambda spec: spec.exec.stdin,
     "files": lambda spec: {},
     "timeout": lambda spec: spec.timeout,
@@ -67,85 +90,144 @@ if _missing or _extra:  # pragma: no cover - configuration guard
     )
 
 
-def _combine_field(mode: str, parent: Any, child: Any) -> Any:
-    if mode == "list_parent_first":
-        return [*(parent or []), *(child or [])]
-    if mode == "list_child_first":
-        return [*(child or []), *(parent or [])]
-    if mode == "fallback":
-        return child if child is not None else parent
-    if mode == "files":
-        return _merge_files(parent or {}, child or {})
-    if mode == "dict_merge":
-        if child is None:
-            if parent is None:
-                return None
-            return dict(parent)
-        merged: dict[str, int] = dict(parent or {})
-        merged.update(child)
-        return merged
-    raise ValueError(f"Unknown propagation mode: {mode}")
-
-
-def _assign_field(mode: str, meta: dict[str, Any], value: Any) -> Any:
-    if mode.startswith("list"):
-        items = list(value)
-        if meta.get("clone"):
-            return _clone_items(items)
-        return items
-    if mode == "dict_merge":
-        return None if value is None else dict(value)
-    if mode == "files":
-        return value
-    if mode == "fallback" and isinstance(value, list):
-        return list(value)
-    return value
+# Combine functions merge the parent's context value with a test's own value.
+# Inherited lists travel as tuples: siblings share them without copies and a
+# list is only built when the value is written back on a test.
 
 
-def _context_value(mode: str, value: Any) -> Any:
-    if mode.startswith("list"):
-        return list(value)
-    if mode == "dict_merge":
-        return None if value is None else dict(value)
-    if mode == "files":
-        return value
-    if mode == "fallback" and isinstance(value, list):
-        return list(value)
-    return value
+def _combine_parent_first(parent: Any, child: Any) -> Any:
+    return (*parent, *child) if child else parent
 
 
-def _initial_context(spec: Spec) -> dict[str, Any]:
-    ctx: dict[str, Any] = {}
-    for name, initializer in _FIELD_INITIALIZERS.items():
-        ctx[name] = initializer(spec)
-    return ctx
+def _combine_child_first(parent: Any, child: Any) -> Any:
+    return (*child, *parent) if child else parent
 
 
-def _propagate(test: TestCase, ctx: dict[str, Any]) -> None:
-    child_ctx: dict[str, Any] = {}
-    for name, meta in TESTCASE_PROPAGATION.items():
-        mode = meta["mode"]
-        parent_value = ctx.get(name)
-        local_value = getattr(test, name)
-        combined = _combine_field(mode, parent_value, local_value)
-        setattr(test, name, _assign_field(mode, meta, combined))
-        child_ctx[name] = _context_value(mode, combined)
+def _combine_fallback(parent: Any, child: Any) -> Any:
+    return child if child is not None else parent
 
-    if test.tests:
-        for child in test.tests:
-            _propagate(child, child_ctx)
 
+def _combine_files(parent: Any, child: Any) -> Any:
+    if not parent and not child:
+        return {}
+    return _merge_files(parent or {}, child or {})
+
+
+def _combine_dict(parent: Any, child: Any) -> Any:
+    if child is None:
+        return parent
+    merged: dict[str, int] = dict(parent or {})
+    merged.update(child)
+    return merged
 
-def merge_spec(spec: Spec) -> Spec:
-    """Return a copy of ``spec`` with inheritable fields propagated."""
 
-    merged = spec.model_copy(deep=True)
+# Assign functions turn a combined value into the one stored on the test; the
+# combined value itself is kept as the context of the test's children.
 
-    base_ctx = _initial_context(merged)
 
-    for test in merged.tests:
-        _propagate(test, base_ctx)
+def _assign_list(value: Any, memo: dict[int, Any]) -> Any:
+    return list(value)
+
+
+def _assign_copy(value: Any, memo: dict[int, Any]) -> Any:
+    if isinstance(value, list | dict):
+        return type(value)(value)
+    return value
+
+
+def _assign_as_is(value: Any, memo: dict[int, Any]) -> Any:
+    return value
+
+
+_COMBINE: dict[str, Callable[[Any, Any], Any]] = {
+    "list_parent_first": _combine_parent_first,
+    "list_child_first": _combine_child_first,
+    "fallback": _combine_fallback,
+    "files": _combine_files,
+    "dict_merge": _combine_dict,
+}
+
+
+def _plan_entry(
+    name: str, meta: dict[str, Any]
+) -> tuple[str, Callable[[Any, Any], Any], Callable[[Any, dict[int, Any]], Any]]:
+    mode = meta["mode"]
+    try:
+        combine = _COMBINE[mode]
+    except KeyError:
+        raise ValueError(f"Unknown propagation mode: {mode}") from None
+    if mode.startswith("list"):
+        assign = _clone_items if meta.get("clone") else _assign_list
+    elif mode == "files":
+        assign = _assign_as_is
+    else:
+        assign = _assign_copy
+    return name, combine, assign
+
+
+# Propagation specialised once per field; contexts are tuples in the same order.
+_PLAN = tuple(_plan_entry(name, meta) for name, meta in TESTCASE_PROPAGATION.items())
+_PLAN_FIELDS = frozenset(TESTCASE_PROPAGATION)
+
+# A context is a bare tuple read positionally alongside _PLAN; a namedtuple
+# would only add a slower constructor since no field is accessed by name.
+_Context = tuple[Any, ...]
+
+
+def _initial_context(spec: Spec) -> _Context:
+    return tuple(_FIELD_INITIALIZERS[name](spec) for name, _, _ in _PLAN)
+
+
+def _propagate(tests: list[TestCase], ctx: _Context) -> list[TestCase]:
+    """
+    Return shallow copies of ``tests`` (and descendants) with ``ctx`` propagated.
+
+    Only the fields written here are replaced on the copies; everything else is
+    shared with the source models, which are left untouched.
+    """
+
+    plan = _PLAN  # local lookups in the loop below
+    # Plain attribute writes: TestCase does not validate assignments, so going
+    # through BaseModel.__setattr__ only costs time. The fields are then flagged
+    # as set in one go, as __setattr__ would have done.
+    set_field = object.__setattr__
+    # Each node is copied when it is popped and stored in its slot of the
+    # pre-sized list that replaces its parent's ``tests``.
+    copies: list[Any] = [None] * len(tests)
+    # Siblings share one clone memo: the inherited items they all receive are
+    # copied once per frame rather than once per sibling.
+    memo: dict[int, Any] = {}
+    stack = [(tests[i], ctx, memo, copies, i) for i in range(len(tests) - 1, -1, -1)]
+    pop, push = stack.pop, stack.extend
+    while stack:
+        source, parent_ctx, memo, siblings, index = pop()
+        test = siblings[index] = source.model_copy()
+        child_ctx: list[Any] = []
+        for (name, combine, assign), parent_value in zip(plan, parent_ctx, strict=True):
+            combined = combine(parent_value, getattr(test, name))
+            set_field(test, name, assign(combined, memo))
+            child_ctx.append(combined)
+        test.__pydantic_fields_set__.update(_PLAN_FIELDS)
+
+        children = test.tests
+        if children:
+            slots: list[Any] = [None] * len(children)
+            test.tests = slots
+            frozen_ctx = tuple(child_ctx)
+            child_memo: dict[int, Any] = {}
+            push(
+                (children[i], frozen_ctx, child_memo, slots, i)
+                for i in range(len(children) - 1, -1, -1)
+            )
+    return copies
+
+
+def merge_spec(spec: Spec) -> Spec:
+    """Return a copy of ``spec`` with inheritable fields propagated."""
 
+    # Copy-on-write: only the nodes on the way are copied, not the whole tree.
+    merged = spec.model_copy()
+    merged.tests = _propagate(spec.tests, _initial_context(spec))
     return merged
 
 
@@ -20,33 +20,35 @@ Key points:
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 # ---------------------------------------------------------------------------
 # Utilities
 # ---------------------------------------------------------------------------
 
-_PERL_M = re.compile(r"^m\/(.*)\/([a-zA-Z]*)$")
-_PERL_S = re.compile(r"^s\/(.*)\/(.*)\/([a-zA-Z]*)$")
+# One pass for both forms: "m/<regex>/<flags>" and "s/<regex>/<repl>/<flags>".
+_PERL = re.compile(
+    r"^(?:m/(?P<m_rx>.*)/(?P<m_flags>[a-zA-Z]*)"
+    r"|s/(?P<s_rx>.*)/(?P<s_repl>.*)/(?P<s_flags>[a-zA-Z]*))$"
+)
 
 
+@lru_cache(maxsize=1024)
 def _parse_perl_like(pattern: str) -> tuple[str, str, str | None]:
     """Parse a Perl-like regex:
     - match:  "m/<regex>/<flags>"  → ("m", regex, flags)
     - sub:    "s/<regex>/<repl>/<flags>" → ("s", "regex:::repl", flags)
     - otherwise:  ("", pattern, None)
     """
-    m = _PERL_M.match(pattern)
-    if m:
-        rx, flags = m.group(1), m.group(2) or None
-        return ("m", rx, flags)
-    s = _PERL_S.match(pattern)
-    if s:
-        rx, repl, flags = s.group(1), s.group(2), s.group(3) or None
-        return ("s", f"{rx}:::{repl}", flags)
-    return ("", pattern, None)
+    m = _PERL.match(pattern)
+    if m is None:
+        return ("", pattern, None)
+    if m["m_rx"] is not None:
+        return ("m", m["m_rx"], m["m_flags"] or None)
+    return ("s", f"{m['s_rx']}:::{m['s_repl']}", m["s_flags"] or None)
 
 
 def _as_str_list(v: Any) -> list[str]:
@@ -79,6 +81,9 @@ def _normalize_ulimit(v: Any) -> dict[str, int] | None:
 
 
 class FilterBase(BaseModel):
+    # Frozen: propagation shares filter instances between test cases.
+    model_config = ConfigDict(frozen=True)
+
     kind: Literal["trim", "lower", "upper", "sub", "map_eval"]
 
 
@@ -346,11 +351,63 @@ def parse_check(obj: Any) -> Check:
     if key == "check_eval":
         return CCheckEval.model_validate(val)
     if key == "capture":
-        return CCapture.model_validate(val)
+        return _parse_capture(val)
 
     raise ValueError(f"Unknown check: {key}")
 
 
+def _nested_capture(item: Any) -> Any:
+    """Return the payload of ``{"capture": payload}`` items, ``None`` otherwise."""
+
+    if isinstance(item, dict) and len(item) == 1 and "capture" in item:
+        return item["capture"]
+    return None
+
+
+def _parse_capture(val: Any) -> CCapture:
+    """
+    Validate a capture check bottom-up with an explicit stack.
+
+    Nested captures are validated before their parent, so each ``_coerce_tests``
+    pass only sees ready-made checks instead of recursing through ``parse_check``.
+    """
+
+    parsed: dict[int, CCapture] = {}
+    pending: set[int] = set()
+    stack: list[Any] = [val]
+    while stack:
+        payload = stack[-1]
+        if id(payload) in parsed:
+            stack.pop()
+            continue
+        tests = payload.get("tests") if isinstance(payload, dict) else None
+        items = tests if isinstance(tests, list) else []
+        nested = [
+            child
+            for child in map(_nested_capture, items)
+            if child is not None and id(child) not in parsed
+        ]
+        if nested:
+            if id(payload) in pending:
+                raise ValueError("Capture checks cannot contain themselves")
+            pending.add(id(payload))
+            stack.extend(nested)
+            continue
+        stack.pop()
+        pending.discard(id(payload))
+        data = payload
+        if any(_nested_capture(item) is not None for item in items):
+            data = {
+                **payload,
+                "tests": [
+                    item if (child := _nested_capture(item)) is None else parsed[id(child)]
+                    for item in items
+                ],
+            }
+        parsed[id(payload)] = CCapture.model_validate(data)
+    return parsed[id(val)]
+
+
 # ---------------------------------------------------------------------------
 # Stream ops (mix filters & checks)
 # ---------------------------------------------------------------------------
@@ -408,6 +465,9 @@ class ExecConfig(BaseModel):
 
 
 class SetupStep(BaseModel):
+    # Frozen: propagation shares steps between test cases.
+    model_config = ConfigDict(frozen=True)
+
     kind: Literal["run", "eval"]
     value: str
 
@@ -429,7 +489,10 @@ class SetupStep(BaseModel):
 
 
 class FileSpec(BaseModel):
-    # Objects are already normalized → skip revalidation
+    # Frozen: propagation shares file specs between test cases and builds merged
+    # ones with ``model_construct`` (ops are already normalized → no revalidation).
+    model_config = ConfigDict(frozen=True)
+
     ops: list[Any] = Field(default_factory=list)
 
     @model_validator(mode="before")
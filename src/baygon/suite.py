@@ -5,9 +5,9 @@ from __future__ import annotations
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable, Sequence
+from typing import Iterable, Sequence
 
-from .context import Context
+from .context import Context, Template, compile_templates
 from .executable import Executable
 from .filters import Filter, registry as filter_registry
 from .matchers import Matcher, MatcherError, build_matcher
@@ -124,7 +124,9 @@ def _build_pipeline(ops: Iterable[StreamOp]) -> list[PipelineStep]:
     return pipeline
 
 
-def _render_stdin(ctx: Context, template: str | Sequence[str] | None) -> str | None:
+def _render_stdin(
+    ctx: Context, template: str | Template | Sequence[str | Template] | None
+) -> str | None:
     if template is None:
         return None
     rendered = ctx.render_value(template)
@@ -135,7 +137,7 @@ def _render_stdin(ctx: Context, template: str | Sequence[str] | None) -> str | N
     return str(rendered)
 
 
-def _render_args(ctx: Context, args: Sequence[str]) -> list[str]:
+def _render_args(ctx: Context, args: Sequence[str | Template]) -> list[str]:
     rendered = ctx.render_value(list(args))
     return [str(arg) for arg in rendered]
 
@@ -169,16 +171,16 @@ class _StreamRuntime:
         for filter_ in global_filters:
             current = _apply_filter(filter_, current, history)
 
+        context = {
+            "on": stream_name,
+            "test": str(test_id),
+            "namespace": ctx.namespace,
+        }
         for step in self._steps:
             if isinstance(step, _FilterStep):
                 current = _apply_filter(step.filter, current, history)
             else:
-                context = {
-                    "on": stream_name,
-                    "test": str(test_id),
-                    "namespace": ctx.namespace,
-                }
-                failure = step.matcher(current, **context)
+                failure = step.matcher.evaluate(current, context)
                 if failure is not None:
                     failures.append(failure)
 
@@ -215,6 +217,11 @@ class _TestRuntime:
             name: _StreamRuntime(_build_pipeline(spec.ops))
             for name, spec in case.files.items()
         }
+        # Templates are parsed once here instead of at every repetition.
+        self._args = compile_templates(list(case.args))
+        self._stdin = compile_templates(case.stdin)
+        self._setup = [(step.kind, compile_templates(step.value)) for step in case.setup]
+        self._teardown = [(step.kind, compile_templates(step.value)) for step in case.teardown]
 
     def _limits(self) -> tuple[int | None, int | None, int | None]:
         limits = self.case.ulimit or {}
@@ -223,10 +230,10 @@ class _TestRuntime:
         nproc = limits.get("nproc")
         return cpu, mem, nproc
 
-    def _run_hooks(self, ctx: Context, hooks: Sequence[Any]) -> None:
-        for step in hooks:
-            rendered = ctx.render(step.value)
-            if step.kind == "eval":
+    def _run_hooks(self, ctx: Context, hooks: Sequence[tuple[str, str | Template]]) -> None:
+        for kind, value in hooks:
+            rendered = ctx.render(value)
+            if kind == "eval":
                 ctx.execute(rendered)
             else:
                 subprocess.run(rendered, shell=True, check=True)
@@ -237,7 +244,7 @@ class _TestRuntime:
         failures: list[MatcherError] = []
 
         try:
-            self._run_hooks(ctx, self.case.setup)
+            self._run_hooks(ctx, self._setup)
         except Exception as exc:  # pragma: no cover - defensive
             failures.append(
                 MatcherError(
@@ -254,8 +261,8 @@ class _TestRuntime:
         repeat = max(self.case.repeat, 1)
 
         for index in range(1, repeat + 1):
-            rendered_args = _render_args(ctx, self.case.args)
-            stdin = _render_stdin(ctx, self.case.stdin)
+            rendered_args = _render_args(ctx, self._args)
+            stdin = _render_stdin(ctx, self._stdin)
             command = [self.executable.filename, *self.base_cmd_args, *rendered_args]
 
             outputs = self.executable.run(
@@ -339,7 +346,7 @@ class _TestRuntime:
             failures.extend(iteration_failures)
 
         try:
-            self._run_hooks(ctx, self.case.teardown)
+            self._run_hooks(ctx, self._teardown)
         except Exception as exc:  # pragma: no cover - defensive
             failures.append(
                 MatcherError(
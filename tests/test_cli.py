@@ -61,3 +61,23 @@ def test_check_auto_reports_missing() -> None:
 
         assert result.exit_code == 1
         assert "Could not read" in result.stderr
+
+
+def test_run_version_fast_path(monkeypatch, capsys) -> None:
+    from baygon import __version__, cli
+
+    monkeypatch.setattr(cli.sys, "argv", ["baygon", "--version"])
+    monkeypatch.setattr(cli, "_build_app", None)  # would fail if the Typer app were built
+
+    cli.run()
+
+    assert capsys.readouterr().out == f"{__version__}\n"
+
+
+def test_import_does_not_load_typer() -> None:
+    import subprocess
+    import sys
+
+    code = "import sys, baygon.cli; print('typer' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from baygon.context import Context, ContextError
+from baygon.context import Context, ContextError, Template, compile_templates
 
 
 def test_execute_and_evaluate_namespace() -> None:
@@ -65,3 +65,49 @@ def test_invalid_expression_reports_error() -> None:
     with pytest.raises(ContextError):
         ctx.evaluate("1 +")
 
+
+
+def test_render_reuses_parsed_template_but_reevaluates() -> None:
+    ctx = Context(initial={"i": 0})
+    rendered = [ctx.render("n={{ i++ }}") for _ in range(3)]
+    assert rendered == ["n=0", "n=1", "n=2"]
+
+
+def test_render_format_spec_ignores_nested_colons() -> None:
+    ctx = Context(initial={"d": {"a:b": 3}, "xs": [1, 2, 3]})
+    assert ctx.render("{{ d['a:b']:>3 }}|{{ xs[1:] }}") == "  3|[2, 3]"
+
+
+def test_render_value_returns_unchanged_containers_as_is() -> None:
+    ctx = Context(initial={"x": 1})
+    static = {"args": ["a", "b"], "nested": ("c",)}
+    assert ctx.render_value(static) is static
+    mixed = ["{{ x }}", static["args"]]
+    rendered = ctx.render_value(mixed)
+    assert rendered == ["1", ["a", "b"]]
+    assert rendered[1] is static["args"]
+
+
+def test_contexts_copy_default_and_custom_builtins() -> None:
+    first, second = Context(), Context()
+    assert first._globals["__builtins__"] is not second._globals["__builtins__"]
+    first.execute("__builtins__['len'] = abs")
+    assert second.evaluate("len('abc')") == 3
+
+    custom = {"len": len}
+    ctx = Context(builtins_namespace=custom)
+    assert ctx.evaluate("len('abc')") == 3
+    assert "__import__" not in custom
+
+
+def test_compiled_templates_render_against_any_context() -> None:
+    compiled = compile_templates(["{{ x * 2 }}", "static", {"k": "{{ x }}!"}])
+    assert isinstance(compiled[0], Template)
+    assert compiled[1] == "static"
+    assert Context(initial={"x": 2}).render_value(compiled) == ["4", "static", {"k": "2!"}]
+    assert compiled[0].render(Context(initial={"x": 5})) == "10"
+
+
+def test_render_supports_braces_and_newlines_inside_mustaches() -> None:
+    ctx = Context(initial={"x": 1})
+    assert ctx.render("{{ {1: 'a'}[x] }}|{{ (x\n+ 1) }}|{{}}") == "a|2|{{}}"
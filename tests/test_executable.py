@@ -1,10 +1,13 @@
+import os
 import stat
+import subprocess
 import sys
 import textwrap
 
 import pytest
 
-from baygon.executable import Executable, InvalidExecutableError
+from baygon import executable
+from baygon.executable import Executable, InvalidExecutableError, RunCase
 
 
 @pytest.mark.parametrize("binary, args, expected", [
@@ -72,3 +75,203 @@ def test_invalid_executable_path(tmp_path):
     non_exec.write_text("data")
     with pytest.raises(InvalidExecutableError):
         Executable(str(non_exec))
+
+
+def test_run_many_preserves_case_order():
+    exe = Executable(sys.executable)
+    code = "import sys; print(sys.argv[1] + sys.stdin.read())"
+    cases = [RunCase(args=("-c", code, str(index)), stdin="!" * index) for index in range(5)]
+    results = exe.run_many(cases, timeout=10)
+    assert [result.stdout for result in results] == [f"{index}{'!' * index}\n" for index in range(5)]
+    assert all(result.exit_status == 0 for result in results)
+
+
+@pytest.mark.parametrize("use_prlimit", [True, False])
+def test_resource_limits_are_applied_to_child(monkeypatch, use_prlimit):
+    if not use_prlimit:
+        # Force the generated preexec_fn fallback.
+        monkeypatch.setattr(executable, "_prlimit_command", lambda *limits: None)
+    exe = Executable(sys.executable)
+    code = "import resource; print(resource.getrlimit(resource.RLIMIT_CPU)[1])"
+    result = exe.run("-c", code, cpu_time=7)
+    assert result.exit_status == 0
+    assert result.stdout == "7\n"
+
+
+def test_prlimit_limits_are_clamped_to_hard_limits(monkeypatch):
+    resource = pytest.importorskip("resource")
+    if executable._prlimit_path() is None:
+        pytest.skip("prlimit(1) not available")
+    monkeypatch.setattr(resource, "getrlimit", lambda limit: (5, 5))
+    assert executable._prlimit_command(7, None, 3)[1:] == ["--cpu=5", "--nproc=3"]
+
+
+def test_hook_receives_command_without_prlimit_prefix():
+    exe = Executable(sys.executable)
+    seen = {}
+    result = exe.run("-c", "print('ok')", cpu_time=7, hook=lambda **kwargs: seen.update(kwargs))
+    assert result.stdout == "ok\n"
+    assert seen["cmd"] == [sys.executable, "-c", "print('ok')"]
+
+
+def test_large_stdin_and_outputs_are_streamed():
+    exe = Executable(sys.executable)
+    code = "import sys; data = sys.stdin.read(); sys.stdout.write(data); sys.stderr.write(data[::-1])"
+    payload = "0123456789" * 50_000
+    result = exe.run("-c", code, stdin=payload)
+    assert result.exit_status == 0
+    assert result.stdout == payload
+    assert result.stderr == payload[::-1]
+
+
+def test_timeout_keeps_partial_output():
+    exe = Executable(sys.executable)
+    code = "import sys, time; print('started', flush=True); time.sleep(10)"
+    result = exe.run("-c", code, timeout=1)
+    assert result.exit_status != 0
+    assert result.stdout == "started\n"
+
+
+def test_run_without_decode_returns_bytes():
+    exe = Executable(sys.executable)
+    result = exe.run("-c", "import sys; sys.stdout.buffer.write(b'\\xff\\x00ok')", decode=False)
+    assert result.exit_status == 0
+    assert result.stdout == b"\xff\x00ok"
+    assert result.stderr == b""
+
+
+def test_run_replaces_invalid_output_bytes():
+    exe = Executable(sys.executable)
+    result = exe.run("-c", "import sys; sys.stdout.buffer.write(b'a\\xffb')")
+    assert result.exit_status == 0
+    assert result.stdout == "a\ufffdb"
+
+
+def test_run_returns_when_child_exits_while_grandchild_holds_pipes():
+    exe = Executable(sys.executable)
+    code = (
+        "import subprocess, sys; "
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(3)']); "
+        "print('parent done')"
+    )
+    result = exe.run("-c", code, timeout=10)
+    assert result.exit_status == 0
+    assert result.stdout == "parent done\n"
+
+
+def test_import_does_not_load_platform_modules():
+    code = "import sys, baygon.executable; print('resource' in sys.modules, 'ctypes' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False False"
+
+
+def test_external_sandbox_wraps_command():
+    exe = Executable(sys.executable)
+    sandbox = {"tool": "env", "args": ("-u", "BAYGON_UNSET")}
+    calls = []
+    result = exe.run("-c", "print('wrapped')", use_external_sandbox=sandbox, hook=lambda **kw: calls.append(kw["cmd"]))
+    assert result.stdout == "wrapped\n"
+    assert calls[0][:4] == ["env", "-u", "BAYGON_UNSET", "--"]
+
+
+def _python_script(path, body):
+    path.write_text(f"#!{sys.executable}\n" + textwrap.dedent(body))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return path
+
+
+def test_in_process_script_runs_as_main_in_worker(tmp_path):
+    script = _python_script(tmp_path / "tool.py", """
+        import sys
+
+        print("loaded")
+
+        def main():
+            print(__name__, sys.argv[1:], input())
+            print("oops", file=sys.stderr)
+            return 3
+
+        if __name__ == "__main__":
+            print("guarded")
+            sys.exit(main())
+    """)
+    exe = Executable(script, in_process=True)
+    result = exe.run("a", 1, stdin="line\n")
+    assert result == (3, "loaded\nguarded\n__main__ ['a', '1'] line\n", "oops\n")
+    assert exe.in_process
+
+    # Timeouts and limits need a dedicated interpreter, which sees the same thing.
+    spawned = exe.run("a", 1, stdin="line\n", timeout=10)
+    assert spawned == result
+
+
+def test_in_process_script_globals_are_reset_between_runs(tmp_path):
+    script = _python_script(tmp_path / "counter.py", """
+        import sys
+
+        count = 0
+
+        def main():
+            global count
+            count += 1
+            print(count)
+            sys.exit(count > 1)
+
+        main()
+    """)
+    exe = Executable(script, in_process=True)
+    assert [exe.run() for _ in range(3)] == [(0, "1\n", "")] * 3
+
+
+def test_in_process_script_rewritten_at_same_path_is_reloaded(tmp_path):
+    script = _python_script(tmp_path / "submission.py", "print('first')\n")
+    exe = Executable(script, in_process=True)
+    assert exe.run().stdout == "first\n"
+    _python_script(script, "print('second one')\n")
+    assert exe.run().stdout == "second one\n"
+    assert exe.in_process
+
+
+def test_exit_code_maps_bool_like_the_interpreter():
+    assert executable._exit_code(True) == 1
+    assert executable._exit_code(False) == 0
+
+
+def test_in_process_falls_back_when_script_does_not_compile(tmp_path):
+    script = _python_script(tmp_path / "broken.py", """
+        print("never"
+    """)
+    exe = Executable(script, in_process=True)
+    result = exe.run("x")
+    assert result.exit_status != 0
+    assert "SyntaxError" in result.stderr
+    assert not exe.in_process
+
+
+def test_inheritable_descriptors_are_not_leaked():
+    if executable.WINDOWS:
+        pytest.skip("POSIX only")
+    read_fd, write_fd = os.pipe()
+    os.set_inheritable(write_fd, True)
+    try:
+        assert executable._inheritable_fds()
+        exe = Executable(sys.executable)
+        code = f"import os; os.fstat({write_fd})"
+        assert exe.run("-c", code).exit_status != 0
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+@pytest.mark.parametrize("use_prlimit", [True, False])
+def test_no_new_privs_is_left_alone(monkeypatch, use_prlimit):
+    if not sys.platform.startswith("linux"):
+        pytest.skip("NoNewPrivs is reported by Linux only")
+    if not use_prlimit:
+        monkeypatch.setattr(executable, "_prlimit_command", lambda *limits: None)
+    exe = Executable(sys.executable)
+    code = "print([line for line in open('/proc/self/status') if line.startswith('NoNewPrivs')][0].split()[1])"
+    with open("/proc/self/status") as status:
+        expected = next(line for line in status if line.startswith("NoNewPrivs")).split()[1]
+    result = exe.run("-c", code, cpu_time=7)
+    assert result.stdout == f"{expected}\n"
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import itertools
+import math
+import re
+import sys
+import types
+
 import pytest
 
 from baygon import add_filter
 from baygon.filters import (
     Filter,
     FilterError,
+    FilterEval,
+    FilterIgnoreSpaces,
+    FilterNone,
     FilterReplace,
     Filters,
     FilterTrim,
     FilterUppercase,
+    _camel_to_snake,
+    _compile_regex,
+    _is_pure_expression,
     registry,
 )
 
@@ -19,6 +31,15 @@ def test_registry_contains_builtin_filters():
     assert {"none", "uppercase", "lowercase", "trim", "ignore_spaces", "replace", "regex", "eval"} <= names
 
 
+@pytest.mark.parametrize("name, expected", [
+    ("IgnoreSpaces", "ignore_spaces"),
+    ("HTTPServer", "http_server"),
+    ("Md5Sum", "md5_sum"),
+])
+def test_camel_to_snake(name, expected):
+    assert _camel_to_snake(name) == expected
+
+
 def test_schema_model_reflects_signature():
     model = FilterReplace.schema_model()
     instance = model(pattern="foo", replacement="bar")
@@ -27,16 +48,87 @@ def test_schema_model_reflects_signature():
     assert instance.input is False
 
 
+def test_schema_model_is_cached_per_class():
+    class FilterLouder(FilterReplace):
+        def __init__(self, pattern: str, *, input: bool = False) -> None:
+            super().__init__(pattern, pattern.upper(), input=input)
+
+    assert FilterReplace.schema_model() is FilterReplace.schema_model()
+    assert set(FilterLouder.schema_model().model_fields) == {"pattern", "input"}
+
+
 def test_registry_create_and_apply():
     regex = registry.create("regex", pattern=r"\s+", replacement="-")
     assert regex("foo bar\tbaz") == "foo-bar-baz"
 
 
+def test_identical_regex_filters_share_compiled_pattern():
+    first = registry.create("regex", pattern=r"\d+", replacement="#", flags="i")
+    second = registry.create("regex", pattern=r"\d+", replacement="*", flags="i")
+    assert first.regex is second.regex
+    assert second("a1b22") == "a*b*"
+
+
+@pytest.mark.parametrize("code, pure", [
+    ("1 + 2", True),
+    (" sqrt(2) * pi ", True),
+    ("(1, -2) if e > 2 else ()", True),
+    ("randint(1, 6)", False),
+    ("iter([1, 2])", False),
+    ("x", False),
+    ("[1, 2]", False),
+    ("a = 1", False),
+])
+def test_is_pure_expression(code, pure):
+    assert _is_pure_expression(code) is pure
+
+
 def test_filters_collection_apply_order():
     filters = Filters([FilterTrim(), FilterUppercase()])
     assert filters.apply("  hello  ") == "HELLO"
 
 
+def test_filters_collection_fuses_builtin_string_filters():
+    filters = Filters([FilterTrim(), FilterReplace("a", "b"), FilterUppercase(), FilterIgnoreSpaces(), FilterNone()])
+    assert len(filters._bound) == 3
+    assert filters.apply("  a a  ") == "BB"
+
+
+def test_filters_collection_merges_single_char_replacements():
+    rules = [("a", "b"), ("b", "c"), ("x", "a"), ("c", "d")]
+    filters = Filters([FilterReplace(pattern, replacement) for pattern, replacement in rules])
+    assert len(filters._bound) == 1
+    assert filters.apply("abcx") == "ddda"
+
+
+def test_ignore_spaces_removes_all_whitespace():
+    assert FilterIgnoreSpaces()(" a\tb\r\nc ") == "abc"
+
+
+def test_filters_collection_apply_many():
+    filters = Filters([FilterTrim(), FilterUppercase()])
+    assert filters.apply_many([" a ", "b  ", ""]) == ["A", "B", ""]
+    assert Filters().apply_many(iter(["x"])) == ["x"]
+
+
+def test_filters_from_trusted_list():
+    items = [FilterTrim(), FilterUppercase()]
+    filters = Filters._from_trusted(items)
+    assert len(filters) == 2
+    assert filters.apply(" ok ") == "OK"
+    items.append(FilterReplace("O", "0"))
+    assert len(filters) == 2
+    assert filters.apply(" ok ") == "OK"
+
+
+def test_filters_collection_rebinds_on_append():
+    filters = Filters([FilterNone()])
+    filters.append(FilterTrim())
+    filters.extend([FilterUppercase()])
+    assert len(filters) == 3
+    assert filters.apply("  hello  ") == "HELLO"
+
+
 def test_add_filter_registers_custom_class():
     class FilterSuffix(Filter):
         def __init__(self, suffix: str, repeat: int = 1, *, input: bool = False) -> None:
@@ -59,3 +151,51 @@ def test_add_filter_registers_custom_class():
         del registry["test_suffix"]
         with pytest.raises(FilterError):
             registry.create("test_suffix")
+
+
+@pytest.mark.parametrize("pattern, flags, value, expected", [
+    ("a$", 0, "a\n", "X\n"),
+    (r"\d", 0, "\u0663", "X"),
+    ("a.c", re.IGNORECASE | re.DOTALL, "A\nC", "X"),
+    ("^b$", re.MULTILINE, "a\nb\n", "a\nX\n"),
+    (r"(a)\1", 0, "aa", "X"),
+])
+def test_compile_regex_keeps_re_semantics(pattern, flags, value, expected):
+    assert _compile_regex(pattern, flags).sub("X", value) == expected
+
+
+def test_compile_regex_maps_flags_onto_re2():
+    pytest.importorskip("re2")
+    compiled = _compile_regex("a.c", re.IGNORECASE | re.DOTALL)
+    assert type(compiled).__module__ == "re2"
+    assert compiled.sub("X", "A\nC") == "X"
+
+
+@pytest.fixture
+def eval_filter(monkeypatch):
+    # ``baygon.eval`` (the ``iter`` helper FilterEval imports) is not part of this tree.
+    counters: dict[object, itertools.cycle] = {}
+
+    def iter_stub(*values, ctx=None):
+        return next(counters.setdefault(ctx, itertools.cycle(values)))
+
+    module = types.ModuleType("baygon.eval")
+    module.iter = iter_stub
+    monkeypatch.setitem(sys.modules, "baygon.eval", module)
+    return FilterEval()
+
+
+def test_eval_filter_expands_every_tag(eval_filter):
+    assert eval_filter.apply("{{ 1 + 1 }} and {{ 2 * 3 }}!") == "2 and 6!"
+
+
+def test_eval_filter_memoizes_pure_expressions_until_rebound(eval_filter):
+    assert eval_filter.exec("2 * pi") == 2 * math.pi
+    assert "2 * pi" in eval_filter._results
+    eval_filter.exec("pi = 3")
+    assert eval_filter.exec("2 * pi") == 6
+
+
+def test_eval_filter_keeps_one_iterator_per_expression(eval_filter):
+    assert eval_filter.apply("{{iter(1, 2)}}-{{iter(1, 2)}}-{{iter(7, 8)}}") == "1-2-7"
+    assert eval_filter._results == {}
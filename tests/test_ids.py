@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
 
 from baygon.ids import TestId, TrackId
@@ -18,6 +21,12 @@ class TestTestId:
         assert TestId(7).parts == (7,)
         assert TestId(TestId("3.4")).parts == (3, 4)
 
+    def test_equal_identifiers_are_shared(self) -> None:
+        child = TestId("1.2")
+        assert TestId((1, 2)) is child
+        assert TestId(1).down(2) is child
+        assert TestId(child) is child
+
     def test_navigation_helpers(self) -> None:
         root = TestId()
         child = root.down()
@@ -37,6 +46,9 @@ class TestTestId:
             TestId(0)
         with pytest.raises(ValueError):
             TestId("1.0")
+        for text in ("", "1.", " 1", "+1", "1_0", "1..2"):
+            with pytest.raises(ValueError):
+                TestId(text)
         with pytest.raises(ValueError):
             TestId([])
         with pytest.raises(TypeError):
@@ -46,6 +58,18 @@ class TestTestId:
         with pytest.raises(ValueError):
             TestId().down(0)
 
+    def test_copy_and_pickle_keep_pool_intact(self) -> None:
+        root = TestId()
+        identifier = TestId("2.3")
+        assert copy.copy(identifier) is identifier
+        assert copy.deepcopy(identifier) is identifier
+        restored = pickle.loads(pickle.dumps(TestId("4.5")))
+        assert restored.parts == (4, 5)
+        assert restored is TestId("4.5")
+        assert TestId("1") is root
+        assert root.parts == (1,)
+        assert identifier.parts == (2, 3)
+
 
 class TestTrackId:
     def test_next_assigns_identifier(self) -> None:
@@ -33,6 +33,27 @@ def test_load_file_detects_format(tmp_path):
     assert load_file(path) == {"answer": 42}
 
 
+def test_load_yaml_file_reports_syntax_errors(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("name: ok\nsteps: [\n", encoding="utf-8")
+    with pytest.raises(ConfigSyntaxError) as excinfo:
+        load_file(path)
+    (issue,) = excinfo.value.issues
+    assert issue.parser == "yaml"
+    assert issue.source == str(path)
+    assert issue.line is not None
+
+
+def test_load_json_file_reports_syntax_errors(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text('{"name": "caf\u00e9",}', encoding="utf-8")
+    with pytest.raises(ConfigSyntaxError) as excinfo:
+        load_file(path)
+    (issue,) = excinfo.value.issues
+    assert issue.parser == "json"
+    assert issue.source == str(path)
+
+
 def test_locate_config_file_prefers_prefix_and_extension(tmp_path: Path) -> None:
     (tmp_path / "baygon.json").write_text("{}", encoding="utf-8")
     preferred = tmp_path / "baygon.yaml"
@@ -56,6 +77,19 @@ def test_locate_config_file_stops_at_git_root(tmp_path: Path) -> None:
     assert located == target
 
 
+def test_locate_config_file_adds_extension_in_parents(tmp_path: Path) -> None:
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    (tmp_path / ".git").mkdir()
+    target = tmp_path / "suite.yml"
+    target.write_text("value: 1\n", encoding="utf-8")
+
+    located = locate_config_file("suite", start_dir=nested)
+
+    assert located == target
+    assert isinstance(located, Path)
+
+
 def test_locate_config_file_raises_when_missing(tmp_path: Path) -> None:
     with pytest.raises(FileNotFoundError):
         locate_config_file("unknown.yaml", start_dir=tmp_path)
@@ -75,6 +109,31 @@ def test_load_file_discovers_config(tmp_path: Path) -> None:
     assert data == {"answer": 42}
 
 
+def test_locate_config_file_ranks_candidates(tmp_path: Path) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "baygon.yml").mkdir()
+    for name in ("tests.yaml", "test_b.yaml", "test_a.json", "test_a.yaml", "other.yaml"):
+        (tmp_path / name).write_text("{}", encoding="utf-8")
+    assert locate_config_file(start_dir=tmp_path) == tmp_path / "test_a.yaml"
+
+
+def test_locate_config_file_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("BAYGON_DISABLE_CACHE", raising=False)
+    (tmp_path / ".git").mkdir()
+    fallback = tmp_path / "tests.yml"
+    fallback.write_text("{}", encoding="utf-8")
+    assert locate_config_file(start_dir=tmp_path) == fallback
+
+    preferred = tmp_path / "baygon.yml"
+    preferred.write_text("{}", encoding="utf-8")
+    assert locate_config_file(start_dir=tmp_path) == fallback
+    locate_config_file.cache_clear()
+    assert locate_config_file(start_dir=tmp_path) == preferred
+
+    preferred.unlink()
+    assert locate_config_file(start_dir=tmp_path) == fallback
+
+
 def test_json_error_contains_location():
     with pytest.raises(ConfigSyntaxError) as excinfo:
         load_text("{foo: 1}", format="json", source="broken.json")
@@ -87,6 +146,15 @@ def test_json_error_contains_location():
     assert "double quotes" in (issue.hint or "")
 
 
+def test_explicit_yaml_format_reports_only_yaml_issue():
+    with pytest.raises(ConfigSyntaxError) as excinfo:
+        load_text("key: [1, 2", format="yaml", source="broken.yaml")
+
+    (issue,) = excinfo.value.issues
+    assert issue.parser == "yaml"
+    assert issue.source == "broken.yaml"
+
+
 def test_auto_collects_all_errors():
     bad_text = "steps: [\n  - run: echo\n"
     with pytest.raises(ConfigSyntaxError) as excinfo:
@@ -97,6 +165,16 @@ def test_auto_collects_all_errors():
     assert all(issue.source == "broken.yml" for issue in excinfo.value.issues)
 
 
+@pytest.mark.parametrize("text, first", [
+    ("steps: [\n  - run: echo\n", "yaml"),
+    ('  {"steps": [}', "json"),
+])
+def test_auto_tries_the_likely_parser_first(text, first):
+    with pytest.raises(ConfigSyntaxError) as excinfo:
+        load_text(text)
+    assert [issue.parser for issue in excinfo.value.issues] == [first, {"json": "yaml", "yaml": "json"}[first]]
+
+
 def test_invalid_format_raises_value_error():
     with pytest.raises(ValueError):
         load_text("{}", format="toml")  # type: ignore[arg-type]
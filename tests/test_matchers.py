@@ -1,9 +1,15 @@
+import dataclasses
 import math
+import pickle
 
 import pytest
 
 from baygon.matchers import (
+    MatchContains,
+    MatcherError,
+    MatcherRegistry,
     Matchers,
+    _normalize_pattern,
     build_matcher,
     iter_matchers,
     matcher_registry,
@@ -35,6 +41,60 @@ def test_regex_matcher_success_and_failure():
     assert "does not match" in str(failure)
 
 
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("plain", "plain"),
+        ("caf\u00e9", "caf\u00e9"),
+        ("a\\tb", "a\tb"),
+        ("\\x41", "A"),
+        ("\u00e9\\d", "\u00e9\\d"),
+        ("\u03bb\\t\U0001f600", "\u03bb\t\U0001f600"),
+    ],
+)
+def test_normalize_pattern(pattern, expected):
+    assert _normalize_pattern(pattern) == expected
+
+
+def test_regex_matcher_with_non_ascii_pattern_and_escape():
+    matcher = matcher_registry.create("match", regex="\u00e9\\d+")
+    assert matcher("\u00e912") is None
+
+
+def test_regex_matchers_share_compiled_patterns():
+    regex = matcher_registry.create("match", regex=r"^v[0-9]+", flags="I")
+    capture = matcher_registry.create("capture", regex=r"^v[0-9]+", flags="i")
+    assert regex.flags == capture.flags
+    assert regex.regex is capture.regex
+    assert regex("V12") is None
+
+
+def test_matcher_name_derived_from_class_name():
+    class MatchHTTPStatusCode(MatchContains):
+        pass
+
+    class MatchStatus(MatchContains):
+        registry_name = "status"
+
+    assert MatchHTTPStatusCode.name() == "http_status_code"
+    assert MatchStatus.name() == "status"
+
+
+def test_schema_model_is_cached_per_class():
+    class MatchPrefix(MatchContains):
+        def __init__(self, value: str, inverse: bool = False) -> None:
+            super().__init__(value, inverse=inverse)
+
+    class MatchStrictPrefix(MatchPrefix):
+        def __init__(self, value: str) -> None:
+            super().__init__(value)
+
+    model = MatchPrefix.schema_model()
+    assert model is MatchPrefix.schema_model()
+    assert set(model.model_fields) == {"value", "inverse"}
+    assert set(MatchStrictPrefix.schema_model().model_fields) == {"value"}
+
+
 def test_contains_and_not_contains():
     contains = matcher_registry.create("contains", value="needle")
     assert contains("haystack needle haystack") is None
@@ -83,6 +143,14 @@ def test_numeric_matchers(kind, expected, samples):
             assert result is not None
 
 
+def test_numeric_matcher_reports_unconvertible_value():
+    matcher = matcher_registry.create("lt", value=10)
+    failure = matcher("ten")
+    assert failure is not None
+    assert "cannot convert 'ten' to float" in str(failure)
+    assert "(11.0) is not less than 10.0" in str(matcher("11"))
+
+
 def test_match_eval_with_namespace():
     matcher = matcher_registry.create("check_eval", expr="math.isclose(value, target)")
     failure = matcher(1.0, namespace={"math": math, "target": 2.0})
@@ -91,6 +159,22 @@ def test_match_eval_with_namespace():
     assert success is None
 
 
+def test_match_eval_compiles_expression_once():
+    first = matcher_registry.create("check_eval", expr="value.startswith('ok')")
+    second = matcher_registry.create("check_eval", expr="value.startswith('ok')")
+    assert first._code is second._code
+    assert first("ok!") is None
+    assert first("ko") is not None
+
+
+def test_match_eval_accepts_statements():
+    matcher = matcher_registry.create(
+        "check_eval", expr="for c in value:\n    _ = c.isdigit()"
+    )
+    assert matcher("a1") is None
+    assert matcher("1a") is not None
+
+
 def test_capture_nested_checks():
     matcher = build_matcher(
         {
@@ -125,6 +209,108 @@ def test_matchers_collection_accumulates_failures():
             matcher_registry.create("contains", value="bar"),
         ]
     )
-    failures = collection.evaluate("foo baz", on="stdout")
+    failures = collection.evaluate("foo baz", {"on": "stdout"})
     assert len(failures) == 1
     assert "bar" in failures[0].details
+    assert failures[0].on == "stdout"
+
+
+def test_matchers_collection_shares_context():
+    seen = []
+
+    class MatchRecord(MatchContains):
+        def _matches(self, value, context):
+            seen.append(context)
+            return super()._matches(value, context)
+
+    context = {"on": "stdout", "test": "1"}
+    collection = Matchers([MatchRecord("a"), MatchRecord("b")])
+    (failure,) = collection.evaluate("a", context)
+    assert seen == [context, context]
+    assert all(item is context for item in seen)
+    assert (failure.on, failure.check) == ("stdout", "1")
+
+
+def test_matchers_collection_converts_value_once():
+    class Output:
+        conversions = 0
+
+        def __str__(self):
+            Output.conversions += 1
+            return "42 apples"
+
+    collection = Matchers(
+        [
+            matcher_registry.create("contains", value="apples"),
+            matcher_registry.create("match", regex=r"^42"),
+            matcher_registry.create("not_equals", value="pears"),
+        ]
+    )
+    assert collection.evaluate(Output()) == []
+    assert Output.conversions == 1
+
+
+def test_matchers_collection_reports_original_value():
+    collection = Matchers([matcher_registry.create("equals", value="43")])
+    (failure,) = collection.evaluate(42, {"on": "exit-status"})
+    assert failure.value == 42
+    assert "Output 42 does not equal '43'" in failure.details
+
+
+def test_matcher_error_formats_details_on_demand():
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "late message"
+
+    error = MatcherError(value="v", expected="e", details=render)
+    assert calls == []
+    assert error.details == "late message"
+    assert str(error) == "late message"
+    assert calls == [1]
+
+
+def test_matcher_error_compares_rendered_details():
+    lazy = MatcherError(value="v", expected="e", details=lambda: "message")
+    eager = MatcherError(value="v", expected="e", details="message")
+    assert lazy == eager
+    assert lazy != MatcherError(value="v", expected="e", details="other")
+    assert repr(lazy) == repr(eager)
+    assert "details='message'" in repr(lazy)
+
+
+def test_matcher_error_supports_dataclass_helpers_and_pickle():
+    error = MatcherError(value="v", expected="e", on="stdout", details=lambda: "message")
+    assert dataclasses.replace(error, value="w") == MatcherError("w", "e", "stdout", details="message")
+    assert dataclasses.asdict(error) == {
+        "value": "v", "expected": "e", "on": "stdout", "check": None, "explain": None, "details": "message",
+    }
+    lazy = MatcherError(value="v", expected="e", details=lambda: "late")
+    assert pickle.loads(pickle.dumps(lazy)) == MatcherError("v", "e", details="late")
+
+
+def test_matcher_registry_validates_assignment():
+    assert isinstance(matcher_registry, dict)
+    assert matcher_registry["contains"] is MatchContains
+    with pytest.raises(TypeError):
+        matcher_registry["contains"] = MatchContains
+    with pytest.raises(TypeError):
+        matcher_registry["bogus"] = int
+    with pytest.raises(KeyError, match="Unknown matcher"):
+        matcher_registry.create("bogus")
+
+
+def test_matcher_registry_validates_bulk_updates():
+    registry = MatcherRegistry()
+    with pytest.raises(TypeError):
+        registry.update({"foo": int})
+    with pytest.raises(TypeError):
+        registry.setdefault("foo", int)
+    with pytest.raises(TypeError):
+        registry |= {"foo": int}
+    registry.update(contains=MatchContains)
+    with pytest.raises(TypeError, match="already registered"):
+        registry.update([("contains", MatchContains)])
+    assert registry.setdefault("contains", MatchContains) is MatchContains
+    assert dict(registry) == {"contains": MatchContains}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from baygon.merge import merge_spec
+from baygon.merge import _clone_items, merge_spec
 from baygon.schema import normalize_spec
 
 
@@ -80,3 +80,93 @@ def test_nested_tests_merge_inheritance_and_override():
     assert child.timeout == 5
     assert child.ulimit == {"cpu": 5, "mem": 1024}
     assert child.args == ["--root", "--parent", "--child"]
+
+
+def test_merge_shares_immutable_filters():
+    raw_spec = {
+        "version": 2,
+        "exec": {"cmd": "prog"},
+        "filters": [{"lower": {}}],
+        "tests": [{"name": "A"}, {"name": "B"}],
+    }
+
+    merged = merge_spec(normalize_spec(raw_spec))
+
+    first, second = merged.tests
+    assert first.filters[0] is second.filters[0]
+    assert first.filters[0].kind == "lower"
+
+
+def test_merge_files_extends_parent_ops_without_touching_parent():
+    raw_spec = {
+        "version": 2,
+        "exec": {"cmd": "prog"},
+        "tests": [
+            {
+                "name": "Group",
+                "files": {"out.txt": [{"trim": {}}]},
+                "tests": [
+                    {"name": "Plain"},
+                    {"name": "Extra", "files": {"out.txt": [{"contains": "ok"}]}},
+                ],
+            }
+        ],
+    }
+
+    merged = merge_spec(normalize_spec(raw_spec))
+
+    (group,) = merged.tests
+    plain, extra = group.tests
+    assert [op.kind for op in group.files["out.txt"].ops] == ["trim"]
+    assert [op.kind for op in plain.files["out.txt"].ops] == ["trim"]
+    assert [op.kind for op in extra.files["out.txt"].ops] == ["trim", "contains"]
+
+
+def test_merge_leaves_source_spec_untouched():
+    raw_spec = {
+        "version": 2,
+        "exec": {"cmd": "prog", "args": ["--root"]},
+        "filters": [{"lower": {}}],
+        "tests": [
+            {
+                "name": "Group",
+                "args": ["--group"],
+                "files": {"out.txt": [{"trim": {}}]},
+                "tests": [{"name": "Leaf", "files": {"out.txt": [{"contains": "ok"}]}}],
+            }
+        ],
+    }
+    spec = normalize_spec(raw_spec)
+    before = spec.model_dump()
+
+    merged = merge_spec(spec)
+
+    assert spec.model_dump() == before
+    (group,) = merged.tests
+    (leaf,) = group.tests
+    assert leaf.args == ["--root", "--group"]
+    assert [op.kind for op in leaf.files["out.txt"].ops] == ["trim", "contains"]
+    assert merged.tests[0] is not spec.tests[0]
+
+
+def test_clone_items_shares_scalars_and_copies_containers():
+    nested = {"key": ["value"]}
+    items = ("text", 3, None, nested)
+
+    cloned = _clone_items(items)
+
+    assert cloned == list(items)
+    assert cloned[0] is items[0]
+    assert cloned[3] is not nested
+    assert _clone_items(()) == []
+
+
+def test_clone_items_reuses_memoized_clones():
+    nested = {"key": ["value"]}
+    memo: dict[int, object] = {}
+
+    first = _clone_items([nested], memo)
+    second = _clone_items([nested], memo)
+
+    assert first[0] is second[0]
+    assert first[0] is not nested
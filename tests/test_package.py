@@ -0,0 +1,22 @@
+"""Tests for the lazily populated top level package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import baygon
+
+
+def test_import_does_not_load_registries() -> None:
+    code = "import sys, baygon; print(any(m in sys.modules for m in ('baygon.filters', 'baygon.matchers')))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_lazy_exports_resolve_to_module_attributes() -> None:
+    from baygon import filters, matchers
+
+    assert baygon.registry is filters.registry
+    assert baygon.matcher_registry is matchers.registry
+    assert set(baygon.__all__) <= set(dir(baygon))
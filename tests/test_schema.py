@@ -3,7 +3,9 @@ from pydantic import ValidationError
 
 from baygon.schema import (
     Spec,
+    _parse_perl_like,
     normalize_spec,
+    parse_check,
 )
 
 # ---------------------------------------------------------------------------
@@ -98,6 +100,20 @@ def test_checks_compact_vs_canonical_and_numbers():
     assert sops[4].explain == ">=1"  # explaination alias
 
 
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("m/a+/i", ("m", "a+", "i")),
+        ("m/a/b/", ("m", "a/b", None)),
+        ("s/a/b/g", ("s", "a:::b", "g")),
+        ("s/a/b/c/", ("s", "a/b:::c", None)),
+        ("plain", ("", "plain", None)),
+    ],
+)
+def test_parse_perl_like(pattern, expected):
+    assert _parse_perl_like(pattern) == expected
+
+
 def test_match_and_sub_perl_like_syntax():
     data = {
         **MINIMAL,
@@ -304,3 +320,29 @@ def test_contains_explain_aliases():
     sops = spec.tests[0].stdout
     assert sops[0].explain == "E1"
     assert sops[1].explain == "E2"
+
+
+def test_deeply_nested_captures_are_parsed_without_recursion():
+    root = {"regex": "(.*)", "tests": []}
+    current = root
+    for _ in range(2000):
+        child = {"regex": "(.*)", "tests": []}
+        current["tests"].append({"capture": child})
+        current = child
+    current["tests"].append({"contains": "x"})
+
+    check = parse_check({"capture": root})
+
+    depth = 0
+    while check.kind == "capture":
+        (check,) = check.tests
+        depth += 1
+    assert depth == 2001
+    assert check.kind == "contains"
+
+
+def test_self_referencing_capture_is_rejected():
+    payload = {"regex": "(.*)", "tests": []}
+    payload["tests"].append({"capture": payload})
+    with pytest.raises(ValueError, match="contain themselves"):
+        parse_check({"capture": payload})
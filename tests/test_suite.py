@@ -116,3 +116,25 @@ def test_suite_run_executes_all(tmp_path):
     results = suite.run()
     assert len(results) == 1
     assert results[0].passed
+
+
+def test_templated_args_are_rendered_at_each_repetition(tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("import sys\nprint(sys.argv[1])\n")
+
+    raw = {
+        "version": 1,
+        "exec": {"cmd": ["python", str(script)]},
+        "tests": [
+            {
+                "name": "counter",
+                "setup": [{"eval": "i = 0"}],
+                "args": ["n{{ i++ }}"],
+                "repeat": 3,
+            }
+        ],
+    }
+
+    suite, _ = _build_suite(raw)
+    (result,) = suite.run()
+    assert [iteration.args[-1] for iteration in result.iterations] == ["n0", "n1", "n2"]